@@ -1,8 +1,41 @@
 """The exports for the qlient.aiohttp module."""
 
-from qlient.aiohttp.backends import AIOHTTPBackend  # skipcq: PY-W2000
-from qlient.aiohttp.clients import AIOHTTPClient  # skipcq: PY-W2000
-from qlient.aiohttp.settings import AIOHTTPSettings  # skipcq: PY-W2000
+from qlient.aiohttp.backends import AIOHTTPBackend
+from qlient.aiohttp.clients import AIOHTTPClient
+from qlient.aiohttp.settings import AIOHTTPSettings
+from qlient.core import (
+    AsyncBackend,
+    AsyncClient,
+    Backend,
+    Client,
+    Directive,
+    Field,
+    Fields,
+    GraphQLRequest,
+    GraphQLResponse,
+    GraphQLSubscriptionRequest,
+    OutOfAsyncContext,
+    Plugin,
+    QlientException,
+    Settings,
+)
 
-# skipcq: PY-W2000
-from qlient.core import *  # noqa
+__all__ = [
+    "AIOHTTPBackend",
+    "AIOHTTPClient",
+    "AIOHTTPSettings",
+    "AsyncBackend",
+    "AsyncClient",
+    "Backend",
+    "Client",
+    "Directive",
+    "Field",
+    "Fields",
+    "GraphQLRequest",
+    "GraphQLResponse",
+    "GraphQLSubscriptionRequest",
+    "OutOfAsyncContext",
+    "Plugin",
+    "QlientException",
+    "Settings",
+]
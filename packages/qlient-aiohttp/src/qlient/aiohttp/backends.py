@@ -1,19 +1,29 @@
+import asyncio
+import functools
 import logging
-import uuid
-from contextlib import asynccontextmanager
+import os
+from collections.abc import Callable
 from typing import Any
 
 import aiohttp
+from aiohttp import hdrs
+from multidict import CIMultiDict, CIMultiDictProxy
 
 from qlient.aiohttp.consts import (
     GRAPHQL_WS_PROTOCOL,
     GRAPHQL_TRANSPORT_WS_PROTOCOL,
-    CONNECTION_INIT,
+    GRAPHQL_WS_MSGPACK_PROTOCOL,
     CONNECTION_ACKNOWLEDGED,
+    CONNECTION_INIT,
     START,
+    CONNECTION_INIT_PREFIX,
+    EMPTY_CONNECTION_INIT,
+    START_PREFIX,
+    START_PAYLOAD,
+    ENVELOPE_SUFFIX,
 )
 from qlient.aiohttp.exceptions import ConnectionRejected
-from qlient.aiohttp.models import GraphQLSubscriptionResponse
+from qlient.aiohttp.models import SUBSCRIPTION_ID_TO_RESPONSE, GraphQLSubscriptionResponse
 from qlient.aiohttp.settings import AIOHTTPSettings
 from qlient.core import (
     AsyncBackend,
@@ -24,13 +34,64 @@ from qlient.core import (
 
 logger = logging.getLogger("qlient")
 
-SUBSCRIPTION_ID_TO_RESPONSE: dict[str, GraphQLSubscriptionResponse] = {}
+JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+
+# the headers are the same for every request, build them only once
+# the content type is set by aiohttp from the payload
+ACCEPT_HEADERS = CIMultiDictProxy(CIMultiDict({hdrs.ACCEPT: JSON_CONTENT_TYPE}))
+
+
+@functools.lru_cache(maxsize=256)
+def encode_payload_head(
+    query: str | None,
+    operation_name: str | None,
+    json_dumps_bytes: Callable[[Any], bytes],
+) -> bytes:
+    """Encode everything of the request payload that precedes the variables.
+
+    The same query is usually sent over and over again with different variables,
+    so the (possibly large) encoded query is cached.
+
+    Args:
+        query: holds the graphql query
+        operation_name: holds the name of the operation
+        json_dumps_bytes: holds the function to encode json with
+
+    Returns:
+        the utf-8 encoded start of the payload, up to and including the "variables" key
+    """
+    return b"".join(
+        (
+            b'{"query":',
+            json_dumps_bytes(query),
+            b',"operationName":',
+            json_dumps_bytes(operation_name),
+            b',"variables":',
+        )
+    )
 
 
 async def close_all():
-    for subscription_id, response in SUBSCRIPTION_ID_TO_RESPONSE.items():
-        logger.info(f"Ending subscription {subscription_id}")
-        await response.close()
+    # closing a response removes it from the registry, close a snapshot of it
+    responses = list(SUBSCRIPTION_ID_TO_RESPONSE.items())
+    for subscription_id, _ in responses:
+        logger.info("Ending subscription %s", subscription_id)
+    # close concurrently, one failing subscription must not keep the others open
+    await asyncio.gather(*(response.close() for _, response in responses), return_exceptions=True)
+
+
+def ensure_acknowledged(message: dict[str, Any]):
+    """Make sure the server acknowledged the connection.
+
+    Args:
+        message: holds the first message received from the server
+
+    Raises:
+        ConnectionRejected: when the message is not the acknowledgement
+    """
+    if message["type"] != CONNECTION_ACKNOWLEDGED:
+        logger.critical("The server did not acknowledged the connection.")
+        raise ConnectionRejected("The server did not acknowledge the connection.")
 
 
 class AIOHTTPBackend(AsyncBackend):
@@ -48,12 +109,15 @@ class AIOHTTPBackend(AsyncBackend):
         Returns:
             A unique subscription id
         """
-        return f"qlient:{cls.__name__}:{uuid.uuid4()}".replace("-", "")
+        return f"qlient:{cls.__name__}:{os.urandom(16).hex()}"
 
     @staticmethod
     def make_payload(request: GraphQLRequest) -> dict[str, Any]:
         """Static method for generating the request payload.
 
+        Unless this method is overridden, the backend does not build this dictionary when sending json requests,
+        the payload is serialized straight to bytes by :meth:`encode_payload`.
+
         Args:
             request: holds the graphql request
 
@@ -66,6 +130,25 @@ class AIOHTTPBackend(AsyncBackend):
             "variables": request.variables,
         }
 
+    def encode_payload(self, request: GraphQLRequest) -> bytes:
+        """Method for encoding the request payload.
+
+        Produces the same json document as :meth:`make_payload`,
+        but reuses the cached encoding of the query and operation name.
+        When a subclass overrides :meth:`make_payload`, its payload is encoded as-is instead.
+
+        Args:
+            request: holds the graphql request
+
+        Returns:
+            the utf-8 encoded json payload
+        """
+        json_dumps_bytes = self.settings.json_dumps_bytes
+        if type(self).make_payload is not AIOHTTPBackend.make_payload:
+            return json_dumps_bytes(self.make_payload(request))
+        head = encode_payload_head(request.query, request.operation_name, json_dumps_bytes)
+        return head + json_dumps_bytes(request.variables) + b"}"
+
     def __init__(
         self,
         endpoint: str,
@@ -88,24 +171,52 @@ class AIOHTTPBackend(AsyncBackend):
         self.ws_endpoint: str = ws_endpoint or self.endpoint
         self.subscription_protocols = subscription_protocols
         self._session: aiohttp.ClientSession | None = session
+        # only sessions created by this backend are closed by it
+        self._owns_session: bool = False
 
-    @property
-    @asynccontextmanager
-    async def session(self) -> aiohttp.ClientSession:
-        """Property to get the session to use for requests.
+    def create_session(self) -> aiohttp.ClientSession:
+        """Method to create the session that is used when no session was given.
+
+        Override this method to customize the connection pool of the default session.
+
+        A graphql client usually talks to a single host, so the pool is bounded per host
+        instead of in total and idle connections are kept alive for longer.
+
+        Returns:
+            a new aiohttp.ClientSession
+        """
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=64,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+        return aiohttp.ClientSession(connector=connector, json_serialize=self.settings.json_dumps)
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Method to get the session to use for requests.
 
         If the session is pre-defined, use that session,
-        otherwise create a new aiohttp.ClientSession.
+        otherwise lazily create one that is reused for all following requests
+        until :meth:`aclose` is called.
 
         Returns:
             the ClientSession to use
         """
-        if self._session is not None:
-            yield self._session
-            return
+        if self._session is None or (self._owns_session and self._session.closed):
+            self._session = self.create_session()
+            self._owns_session = True
+        return self._session
 
-        async with aiohttp.ClientSession() as session:
-            yield session
+    async def aclose(self):
+        """Close the session if it was created by this backend.
+
+        A pre-defined session is left open, it belongs to the caller.
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._owns_session = False
 
     async def execute_query(self, request: GraphQLRequest) -> GraphQLResponse:
         """Method to execute a query on the http server.
@@ -123,21 +234,21 @@ class AIOHTTPBackend(AsyncBackend):
         Returns:
             the query GraphQLResponse
         """
-        payload_dict = self.make_payload(request)
-        payload_str = self.settings.json_dumps(payload_dict)
-        logger.debug(f"Sending request: {payload_str}")
-        async with self.session as session:
-            async with session.post(
-                self.endpoint,
-                data=payload_str,
-                headers={
-                    "Content-Type": "application/json; charset=utf-8",
-                    "Accept": "application/json; charset=utf-8",
-                },
-            ) as response:
-                response_str = await response.text()
-                response_body = self.settings.json_loads(response_str)
-                return GraphQLResponse(request, response_body)
+        json_loads = self.settings.json_loads
+        payload = self.encode_payload(request)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending request: %s", payload.decode())
+        session = await self.get_session()
+        # the payload is already encoded, post it as json body as-is
+        # instead of letting aiohttp serialize the dictionary with `json=` once again
+        async with session.post(
+            self.endpoint,
+            data=aiohttp.BytesPayload(payload, content_type=JSON_CONTENT_TYPE),
+            headers=ACCEPT_HEADERS,
+        ) as response:
+            # json_loads accepts the raw bytes, decoding them to str first would only be an extra pass
+            response_body = json_loads(await response.read())
+            return GraphQLResponse(request, response_body)
 
     async def execute_mutation(self, request: GraphQLRequest) -> GraphQLResponse:
         """Method to execute a mutation on the http server.
@@ -167,27 +278,77 @@ class AIOHTTPBackend(AsyncBackend):
 
         Returns:
         """
-        payload = self.make_payload(request)
-        async with self.session as session:
-            request.subscription_id = request.subscription_id or self.generate_subscription_id()
+        session = await self.get_session()
+        request.subscription_id = request.subscription_id or self.generate_subscription_id()
+
+        protocols = self.subscription_protocols
+        if self.settings.supports_binary and GRAPHQL_WS_MSGPACK_PROTOCOL not in protocols:
+            # prefer the binary protocol, servers that do not know it choose one of the others
+            protocols = [GRAPHQL_WS_MSGPACK_PROTOCOL, *protocols]
+
+        ws = await session.ws_connect(self.endpoint, protocols=protocols, autoclose=False)
+
+        if ws.protocol == GRAPHQL_WS_MSGPACK_PROTOCOL:
+            await self.start_binary_subscription(ws, request)
+        else:
+            await self.start_subscription(ws, request)
 
-            ws = await session.ws_connect(self.endpoint, protocols=self.subscription_protocols, autoclose=False)
+        response = GraphQLSubscriptionResponse(request, ws, settings=self.settings)
 
-            # initiate connection
-            await ws.send_str(self.settings.json_dumps({"type": CONNECTION_INIT, "payload": request.options}))
+        SUBSCRIPTION_ID_TO_RESPONSE[request.subscription_id] = response
 
-            initial_response = self.settings.json_loads(await ws.receive_str())
-            if initial_response["type"] != CONNECTION_ACKNOWLEDGED:
-                logger.critical("The server did not acknowledged the connection.")
-                raise ConnectionRejected("The server did not acknowledge the connection.")
+        return response
 
-            # connection acknowledged, start subscription
-            await ws.send_str(
-                self.settings.json_dumps({"type": START, "id": request.subscription_id, "payload": payload})
+    async def start_subscription(self, ws: aiohttp.ClientWebSocketResponse, request: GraphQLSubscriptionRequest):
+        """Run the initiation sequence with json messages sent as text frames.
+
+        Args:
+            ws: holds the connected websocket
+            request: holds the request to execute
+        """
+        json_loads = self.settings.json_loads
+        json_dumps_bytes = self.settings.json_dumps_bytes
+
+        # initiate connection
+        # the graphql websocket protocols only accept text frames,
+        # so the utf-8 encoded json is sent as text frame as-is
+        if request.options:
+            connection_init = CONNECTION_INIT_PREFIX + json_dumps_bytes(request.options) + ENVELOPE_SUFFIX
+        else:
+            connection_init = EMPTY_CONNECTION_INIT
+        await ws.send_frame(connection_init, aiohttp.WSMsgType.TEXT)
+
+        ensure_acknowledged(json_loads(await ws.receive_str()))
+
+        # connection acknowledged, start subscription
+        start = b"".join(
+            (
+                START_PREFIX,
+                json_dumps_bytes(request.subscription_id),
+                START_PAYLOAD,
+                self.encode_payload(request),
+                ENVELOPE_SUFFIX,
             )
+        )
+        await ws.send_frame(start, aiohttp.WSMsgType.TEXT)
+
+    async def start_binary_subscription(
+        self,
+        ws: aiohttp.ClientWebSocketResponse,
+        request: GraphQLSubscriptionRequest,
+    ):
+        """Run the initiation sequence with messages encoded by the binary settings, sent as binary frames.
+
+        Args:
+            ws: holds the connected websocket
+            request: holds the request to execute
+        """
+        binary_loads = self.settings.binary_loads
+        binary_dumps = self.settings.binary_dumps
 
-            response = GraphQLSubscriptionResponse(request, ws, settings=self.settings)
+        await ws.send_bytes(binary_dumps({"type": CONNECTION_INIT, "payload": request.options or {}}))
 
-            SUBSCRIPTION_ID_TO_RESPONSE[request.subscription_id] = response
+        ensure_acknowledged(binary_loads(await ws.receive_bytes()))
 
-            return response
+        start = {"type": START, "id": request.subscription_id, "payload": self.make_payload(request)}
+        await ws.send_bytes(binary_dumps(start))
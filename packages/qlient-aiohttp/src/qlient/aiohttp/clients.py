@@ -24,3 +24,9 @@ class AIOHTTPClient(AsyncClient):
             backend = AIOHTTPBackend(backend)
 
         super().__init__(backend, **kwargs)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+        if isinstance(self.backend, AIOHTTPBackend):
+            # release the connection pool of the backend's own session
+            await self.backend.aclose()
@@ -1,6 +1,9 @@
 # Protocols
 GRAPHQL_WS_PROTOCOL = "graphql-ws"
 GRAPHQL_TRANSPORT_WS_PROTOCOL = "graphql-transport-ws"
+# the graphql-ws messages, encoded by the binary settings and sent as binary frames.
+# This subprotocol is specific to qlient, it is only offered when the binary settings are set.
+GRAPHQL_WS_MSGPACK_PROTOCOL = "graphql-ws+msgpack"
 
 # GQL Control Strings
 CONNECTION_INIT = "connection_init"
@@ -13,3 +16,11 @@ CONNECTION_TERMINATE = "connection_terminate"
 DATA = "data"
 ERROR = "error"
 COMPLETE = "complete"
+
+# Encoded message envelopes, the variable parts are appended in between
+CONNECTION_INIT_PREFIX = b'{"type":"connection_init","payload":'
+EMPTY_CONNECTION_INIT = b'{"type":"connection_init","payload":{}}'
+START_PREFIX = b'{"type":"start","id":'
+START_PAYLOAD = b',"payload":'
+STOP_PREFIX = b'{"type":"stop","id":'
+ENVELOPE_SUFFIX = b"}"
@@ -1,13 +1,25 @@
+import weakref
 from collections.abc import AsyncGenerator
 
 import aiohttp
 
-from qlient.aiohttp.consts import CONNECTION_TERMINATE, CONNECTION_ERROR, COMPLETE, CONNECTION_KEEP_ALIVE, STOP
+from qlient.aiohttp.consts import (
+    CONNECTION_TERMINATE,
+    CONNECTION_ERROR,
+    COMPLETE,
+    CONNECTION_KEEP_ALIVE,
+    STOP,
+    STOP_PREFIX,
+    ENVELOPE_SUFFIX,
+    GRAPHQL_WS_MSGPACK_PROTOCOL,
+)
 from qlient.aiohttp.settings import AIOHTTPSettings
 from qlient.core import GraphQLResponse, GraphQLSubscriptionRequest
 
 
 class GraphQLSubscriptionResponse(GraphQLResponse):
+    __slots__ = ("__active", "ws", "settings", "_stop_frame", "_binary")
+
     request: GraphQLSubscriptionRequest
 
     def __init__(
@@ -22,21 +34,43 @@ class GraphQLSubscriptionResponse(GraphQLResponse):
         self.__active: bool = False
         self.ws: aiohttp.ClientWebSocketResponse = socket
         self.settings: AIOHTTPSettings = settings
+        self._stop_frame: bytes | None = None
+        # messages are encoded by the binary settings and sent as binary frames
+        self._binary: bool = socket.protocol == GRAPHQL_WS_MSGPACK_PROTOCOL
 
         super().__init__(request, self.message_generator())
 
     async def message_generator(self) -> AsyncGenerator:
+        """Yield a response for every data message received on the websocket.
+
+        Text and binary frames are both accepted and passed to `json_loads` as received (str or bytes).
+        When the `graphql-ws+msgpack` subprotocol was negotiated, only binary frames are accepted
+        and they are decoded with `binary_loads` instead.
+
+        Yields:
+            a GraphQLResponse per data message
+        """
+        # resolve the hot path lookups once instead of for every message
+        loads = self.settings.binary_loads if self._binary else self.settings.json_loads
+        binary_only = self._binary
+        request = self.request
+        text, binary, error = aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY, aiohttp.WSMsgType.ERROR
+
         msg: aiohttp.WSMessage
         async for msg in self.ws:
-            if msg.type == aiohttp.WSMsgType.ERROR:
+            if msg.type == error:
                 # break the iterator
                 await self.ws.close()
                 break
 
-            if msg.type != aiohttp.WSMsgType.TEXT:
-                raise TypeError(f"Expected {aiohttp.WSMsgType.TEXT}; Got {msg.type}")
+            if msg.type not in (text, binary):
+                raise TypeError(f"Expected {text} or {binary}; Got {msg.type}")
 
-            data = msg.json(loads=self.settings.json_loads)
+            if binary_only and msg.type == text:
+                raise TypeError(f"Expected {binary} on the {GRAPHQL_WS_MSGPACK_PROTOCOL} subprotocol; Got {msg.type}")
+
+            # text frames hold a str, binary frames hold bytes, json_loads handles both without re-encoding
+            data = loads(msg.data)
             data_type = data["type"]
 
             if data_type in (CONNECTION_TERMINATE, CONNECTION_ERROR, COMPLETE):
@@ -47,11 +81,25 @@ class GraphQLSubscriptionResponse(GraphQLResponse):
             if data_type == CONNECTION_KEEP_ALIVE:
                 continue
 
-            yield GraphQLResponse(self.request, data["payload"])
+            yield GraphQLResponse(request, data["payload"])
 
     async def end(self):
-        await self.ws.send_str(self.settings.json_dumps({"type": STOP, "id": self.request.subscription_id}))
+        if self._stop_frame is None:
+            if self._binary:
+                self._stop_frame = self.settings.binary_dumps({"type": STOP, "id": self.request.subscription_id})
+            else:
+                subscription_id = self.settings.json_dumps_bytes(self.request.subscription_id)
+                self._stop_frame = STOP_PREFIX + subscription_id + ENVELOPE_SUFFIX
+        opcode = aiohttp.WSMsgType.BINARY if self._binary else aiohttp.WSMsgType.TEXT
+        await self.ws.send_frame(self._stop_frame, opcode)
 
     async def close(self):
+        SUBSCRIPTION_ID_TO_RESPONSE.pop(self.request.subscription_id, None)
         await self.end()
         await self.ws.close()
+
+
+# the registry of open subscriptions, closed or garbage collected responses drop out of it
+SUBSCRIPTION_ID_TO_RESPONSE: "weakref.WeakValueDictionary[str, GraphQLSubscriptionResponse]" = (
+    weakref.WeakValueDictionary()
+)
@@ -1,18 +1,65 @@
 """This module contains the aio http settings."""
 
-import json
 from collections.abc import Callable
 from typing import Any
 
-from qlient.core.settings import Settings
+from qlient.core.settings import JSONSettings, default_json_dumps, default_json_loads
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
 
-class AIOHTTPSettings(Settings):
-    """The AIO http settings."""
+
+def msgpack_loads(data: bytes) -> Any:
+    """Deserialize the given msgpack encoded data, use it as `binary_loads`.
+
+    Requires `msgpack` (`pip install qlient-aiohttp[msgpack]`).
+    """
+    if msgpack is None:  # pragma: no cover
+        raise ImportError("msgpack is not installed, install it with `pip install qlient-aiohttp[msgpack]`")
+    return msgpack.unpackb(data, raw=False)
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """Serialize the given object to msgpack, use it as `binary_dumps`.
+
+    Requires `msgpack` (`pip install qlient-aiohttp[msgpack]`).
+    """
+    if msgpack is None:  # pragma: no cover
+        raise ImportError("msgpack is not installed, install it with `pip install qlient-aiohttp[msgpack]`")
+    return msgpack.packb(obj)
+
+
+class AIOHTTPSettings(JSONSettings):
+    """The AIO http settings.
+
+    Install `orjson` (`pip install qlient-aiohttp[orjson]`) for faster (de)serialization, see :class:`JSONSettings`.
+
+    `binary_loads` and `binary_dumps` (de)serialize subscription messages sent as binary frames. They are not set
+    by default. Only when both are set, the backend additionally offers the qlient specific `graphql-ws+msgpack`
+    subprotocol and uses them if the server accepts it. Pass :func:`msgpack_loads` and :func:`msgpack_dumps`
+    to use msgpack (`pip install qlient-aiohttp[msgpack]`):
+
+    >>> settings = AIOHTTPSettings(binary_loads=msgpack_loads, binary_dumps=msgpack_dumps)
+    """
+
+    __slots__ = ("binary_loads", "binary_dumps")
 
     def __init__(
-        self, json_loads: Callable[[str], Any] = json.loads, json_dumps: Callable[..., str] = json.dumps, **kwargs
+        self,
+        json_loads: Callable[[str | bytes], Any] = default_json_loads,
+        json_dumps: Callable[..., str] = default_json_dumps,
+        json_dumps_bytes: Callable[[Any], bytes] | None = None,
+        binary_loads: Callable[[bytes], Any] | None = None,
+        binary_dumps: Callable[[Any], bytes] | None = None,
+        **kwargs,
     ):
-        super().__init__(**kwargs)
-        self.json_loads: Callable[[str], Any] = json_loads
-        self.json_dumps: Callable[..., str] = json_dumps
+        super().__init__(json_loads=json_loads, json_dumps=json_dumps, json_dumps_bytes=json_dumps_bytes, **kwargs)
+        self.binary_loads: Callable[[bytes], Any] | None = binary_loads
+        self.binary_dumps: Callable[[Any], bytes] | None = binary_dumps
+
+    @property
+    def supports_binary(self) -> bool:
+        """Whether messages can be (de)serialized for binary frames."""
+        return self.binary_loads is not None and self.binary_dumps is not None
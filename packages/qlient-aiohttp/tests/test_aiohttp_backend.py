@@ -0,0 +1,138 @@
+import json
+
+import aiohttp
+import aiohttp.web
+import pytest
+
+from qlient.aiohttp import AIOHTTPBackend, AIOHTTPSettings
+from qlient.aiohttp.consts import GRAPHQL_WS_MSGPACK_PROTOCOL
+from qlient.aiohttp.backends import SUBSCRIPTION_ID_TO_RESPONSE, close_all
+from qlient.core import GraphQLRequest, GraphQLSubscriptionRequest
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_backend_reuses_own_session():
+    backend = AIOHTTPBackend("http://localhost/graphql")
+
+    session = await backend.get_session()
+    assert isinstance(session, aiohttp.ClientSession)
+    assert await backend.get_session() is session
+
+    await backend.aclose()
+    assert session.closed
+    assert await backend.get_session() is not session
+    await backend.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_backend_session_pool_is_bounded_per_host():
+    backend = AIOHTTPBackend("http://localhost/graphql")
+
+    session = await backend.get_session()
+    assert session.connector.limit == 0
+    assert session.connector.limit_per_host == 64
+    assert session.json_serialize is backend.settings.json_dumps
+    await backend.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_backend_does_not_close_given_session():
+    async with aiohttp.ClientSession() as session:
+        backend = AIOHTTPBackend("http://localhost/graphql", session=session)
+        assert await backend.get_session() is session
+
+        await backend.aclose()
+        assert not session.closed
+
+
+def test_aiohttp_backend_generate_subscription_id():
+    subscription_id = AIOHTTPBackend.generate_subscription_id()
+    prefix, random_part = subscription_id.rsplit(":", 1)
+
+    assert prefix == "qlient:AIOHTTPBackend"
+    assert len(random_part) == 32
+    int(random_part, 16)
+    assert subscription_id != AIOHTTPBackend.generate_subscription_id()
+
+
+def test_aiohttp_backend_encode_payload():
+    backend = AIOHTTPBackend("http://localhost/graphql")
+    request = GraphQLRequest(query='query { foo(bar: "\\u00e4") }', variables={"limit": 1}, operation_name="foo")
+
+    encoded = backend.encode_payload(request)
+    assert backend.settings.json_loads(encoded) == backend.make_payload(request)
+
+    request.variables = {"limit": 2}
+    assert backend.settings.json_loads(backend.encode_payload(request))["variables"] == {"limit": 2}
+
+
+def test_aiohttp_backend_encode_payload_uses_overridden_make_payload():
+    class PersistedQueryBackend(AIOHTTPBackend):
+        @staticmethod
+        def make_payload(request: GraphQLRequest) -> dict:
+            return {**AIOHTTPBackend.make_payload(request), "extensions": {"persistedQuery": {"version": 1}}}
+
+    backend = PersistedQueryBackend("http://localhost/graphql")
+    request = GraphQLRequest(query="query { foo }", variables={}, operation_name=None)
+    assert backend.settings.json_loads(backend.encode_payload(request)) == backend.make_payload(request)
+
+
+@pytest.mark.asyncio
+async def test_close_all_closes_every_subscription():
+    closed = []
+
+    class _Response:
+        def __init__(self, subscription_id: str):
+            self.subscription_id = subscription_id
+
+        async def close(self):
+            SUBSCRIPTION_ID_TO_RESPONSE.pop(self.subscription_id, None)
+            closed.append(self.subscription_id)
+            if self.subscription_id == "1":
+                raise RuntimeError("failed to close")
+
+    responses = [_Response("1"), _Response("2")]
+    for response in responses:
+        SUBSCRIPTION_ID_TO_RESPONSE[response.subscription_id] = response
+
+    await close_all()
+    assert sorted(closed) == ["1", "2"]
+    assert not SUBSCRIPTION_ID_TO_RESPONSE
+
+
+def _binary_loads(data: bytes):
+    return json.loads(data)
+
+
+def _binary_dumps(obj) -> bytes:
+    return json.dumps(obj).encode()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_backend_subscription_over_binary_protocol(aiohttp_client):
+    received = []
+
+    async def handler(request: aiohttp.web.Request) -> aiohttp.web.WebSocketResponse:
+        ws = aiohttp.web.WebSocketResponse(protocols=[GRAPHQL_WS_MSGPACK_PROTOCOL])
+        await ws.prepare(request)
+        async for msg in ws:
+            assert msg.type == aiohttp.WSMsgType.BINARY
+            message = _binary_loads(msg.data)
+            received.append(message)
+            if message["type"] == "connection_init":
+                await ws.send_bytes(_binary_dumps({"type": "connection_ack"}))
+            elif message["type"] == "start":
+                payload = {"data": {"count": 0}}
+                await ws.send_bytes(_binary_dumps({"type": "data", "id": message["id"], "payload": payload}))
+                await ws.send_bytes(_binary_dumps({"type": "complete", "id": message["id"]}))
+        return ws
+
+    app = aiohttp.web.Application()
+    app.router.add_get("/graphql", handler)
+    settings = AIOHTTPSettings(binary_loads=_binary_loads, binary_dumps=_binary_dumps)
+    backend = AIOHTTPBackend("/graphql", session=await aiohttp_client(app), settings=settings)
+
+    request = GraphQLSubscriptionRequest(query="subscription { count }", subscription_id="1")
+    response = await backend.execute_subscription(request)
+    assert [message.data async for message in response] == [{"count": 0}]
+    assert [message["type"] for message in received] == ["connection_init", "start", "stop"]
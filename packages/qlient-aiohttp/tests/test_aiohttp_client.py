@@ -39,3 +39,11 @@ async def test_async_client_subscription(qlient_aiohttp_client: AIOHTTPClient):
         count += 1
 
     assert count == 3
+
+
+@pytest.mark.asyncio
+async def test_async_client_subscription_without_options(qlient_aiohttp_client: AIOHTTPClient):
+    result = await qlient_aiohttp_client.subscription.count(target=2)
+    assert isinstance(result.request.subscription_id, str)
+    assert result.request.options == {}
+    assert [num.data["count"] async for num in result] == [0, 1]
@@ -0,0 +1,84 @@
+import aiohttp
+import pytest
+
+from qlient.aiohttp.models import SUBSCRIPTION_ID_TO_RESPONSE, GraphQLSubscriptionResponse
+from qlient.core import GraphQLSubscriptionRequest
+
+
+class _FakeWebSocket:
+    def __init__(self, messages=()):
+        self.messages = list(messages)
+        self.frames = []
+        self.closed = False
+        self.protocol = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.messages:
+            raise StopAsyncIteration
+        return self.messages.pop(0)
+
+    async def send_frame(self, message, opcode, compress=None):
+        self.frames.append((message, opcode))
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_subscription_response_close_sends_stop():
+    ws = _FakeWebSocket()
+    response = GraphQLSubscriptionResponse(GraphQLSubscriptionRequest(subscription_id="1"), ws)
+
+    await response.close()
+    assert ws.closed
+    assert len(ws.frames) == 1
+    assert response.settings.json_loads(ws.frames[0][0]) == {"type": "stop", "id": "1"}
+
+
+@pytest.mark.asyncio
+async def test_subscription_response_accepts_text_and_binary_frames():
+    ws = _FakeWebSocket(
+        [
+            aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, '{"type": "data", "payload": {"data": {"count": 0}}}', None),
+            aiohttp.WSMessage(aiohttp.WSMsgType.BINARY, b'{"type": "data", "payload": {"data": {"count": 1}}}', None),
+            aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, '{"type": "complete"}', None),
+        ]
+    )
+    response = GraphQLSubscriptionResponse(GraphQLSubscriptionRequest(subscription_id="1"), ws)
+
+    assert [message.data["count"] async for message in response] == [0, 1]
+    assert ws.closed
+
+
+@pytest.mark.asyncio
+async def test_subscription_response_close_unregisters_response():
+    response = GraphQLSubscriptionResponse(GraphQLSubscriptionRequest(subscription_id="1"), _FakeWebSocket())
+    SUBSCRIPTION_ID_TO_RESPONSE["1"] = response
+
+    await response.close()
+    assert "1" not in SUBSCRIPTION_ID_TO_RESPONSE
+
+
+def test_subscription_response_has_no_instance_dict():
+    response = GraphQLSubscriptionResponse(GraphQLSubscriptionRequest(subscription_id="1"), _FakeWebSocket())
+    assert not hasattr(response, "__dict__")
+    assert not hasattr(response.settings, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_subscription_response_rejects_text_frames_on_binary_protocol():
+    import re
+
+    from qlient.aiohttp import AIOHTTPSettings
+    from qlient.aiohttp.consts import GRAPHQL_WS_MSGPACK_PROTOCOL
+
+    ws = _FakeWebSocket([aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, '{"type": "complete"}', None)])
+    ws.protocol = GRAPHQL_WS_MSGPACK_PROTOCOL
+    settings = AIOHTTPSettings(binary_loads=bytes, binary_dumps=bytes)
+    response = GraphQLSubscriptionResponse(GraphQLSubscriptionRequest(subscription_id="1"), ws, settings=settings)
+
+    with pytest.raises(TypeError, match=re.escape(GRAPHQL_WS_MSGPACK_PROTOCOL)):
+        [message async for message in response]
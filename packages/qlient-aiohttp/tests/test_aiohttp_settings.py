@@ -0,0 +1,48 @@
+from qlient.aiohttp.settings import AIOHTTPSettings
+
+
+def test_aiohttp_settings_json_defaults():
+    settings = AIOHTTPSettings()
+
+    payload = settings.json_dumps({"query": "query { foo }"})
+    assert isinstance(payload, str)
+    assert settings.json_loads(payload) == {"query": "query { foo }"}
+    assert settings.json_loads(payload.encode()) == {"query": "query { foo }"}
+
+
+def test_aiohttp_settings_custom_json():
+    def my_loads(_):
+        return "loaded"
+
+    def my_dumps(_):
+        return "dumped"
+
+    settings = AIOHTTPSettings(json_loads=my_loads, json_dumps=my_dumps)
+    assert settings.json_loads("{}") == "loaded"
+    assert settings.json_dumps({}) == "dumped"
+
+
+def test_aiohttp_settings_json_dumps_bytes_default():
+    settings = AIOHTTPSettings()
+    assert settings.json_loads(settings.json_dumps_bytes({"type": "stop"})) == {"type": "stop"}
+
+
+def test_aiohttp_settings_json_dumps_bytes_follows_custom_json_dumps():
+    def my_dumps(_):
+        return "dumped"
+
+    settings = AIOHTTPSettings(json_dumps=my_dumps)
+    assert settings.json_dumps_bytes({}) == b"dumped"
+
+
+def test_aiohttp_settings_supports_binary_only_with_both_hooks():
+    assert AIOHTTPSettings(binary_loads=bytes, binary_dumps=bytes).supports_binary
+    assert not AIOHTTPSettings(binary_loads=bytes, binary_dumps=None).supports_binary
+    assert not AIOHTTPSettings(binary_loads=None, binary_dumps=bytes).supports_binary
+
+
+def test_aiohttp_settings_binary_is_opt_in():
+    settings = AIOHTTPSettings()
+    assert settings.binary_loads is None
+    assert settings.binary_dumps is None
+    assert not settings.supports_binary
@@ -1,12 +1,8 @@
 """This module contains all core related exports."""
 
-from qlient.core.backends import AsyncBackend, Backend  # skipcq: PY-W2000
-from qlient.core.clients import AsyncClient, Client  # skipcq: PY-W2000
-
-# skipcq: PY-W2000
+from qlient.core.backends import AsyncBackend, Backend
+from qlient.core.clients import AsyncClient, Client
 from qlient.core.exceptions import OutOfAsyncContext, QlientException
-
-# skipcq: PY-W2000
 from qlient.core.models import (
     Directive,
     Field,
@@ -15,5 +11,23 @@ from qlient.core.models import (
     GraphQLResponse,
     GraphQLSubscriptionRequest,
 )
-from qlient.core.plugins import Plugin  # skipcq: PY-W2000
-from qlient.core.settings import Settings  # skipcq: PY-W2000
+from qlient.core.plugins import Plugin
+from qlient.core.settings import JSONSettings, Settings
+
+__all__ = [
+    "AsyncBackend",
+    "Backend",
+    "AsyncClient",
+    "Client",
+    "OutOfAsyncContext",
+    "QlientException",
+    "Directive",
+    "Field",
+    "Fields",
+    "GraphQLRequest",
+    "GraphQLResponse",
+    "GraphQLSubscriptionRequest",
+    "Plugin",
+    "Settings",
+    "JSONSettings",
+]
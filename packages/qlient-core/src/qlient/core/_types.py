@@ -1,24 +1,20 @@
 from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
-from typing import (
-    Any,
-    Optional,
-    Union,
-)
+from typing import Any, TypeAlias
 
-JSON = Union[str, int, float, bool, None, dict[str, "JSON"], list["JSON"]]
+JSON: TypeAlias = str | int | float | bool | None | dict[str, "JSON"] | list["JSON"]
 
-RawSchema = dict[str, JSON]
+RawSchema: TypeAlias = dict[str, JSON]
 
-GraphQLQueryType = str
-GraphQLVariablesType = Optional[dict[str, JSON]]
-GraphQLOperationNameType = Optional[str]
-GraphQLReturnType = dict[str, JSON]
-GraphQLReturnTypeIterator = Union[Iterator[GraphQLReturnType], Generator[GraphQLReturnType, None, None]]
-AsyncGraphQLReturnTypeIterator = Union[AsyncIterator[GraphQLReturnType], AsyncGenerator[GraphQLReturnType, None]]
-GraphQLAnyReturnType = Union[GraphQLReturnType, GraphQLReturnTypeIterator, AsyncGraphQLReturnTypeIterator]
-GraphQLContextType = Any
-GraphQLRootType = Any
+GraphQLQueryType: TypeAlias = str
+GraphQLVariablesType: TypeAlias = dict[str, JSON] | None
+GraphQLOperationNameType: TypeAlias = str | None
+GraphQLReturnType: TypeAlias = dict[str, JSON]
+GraphQLReturnTypeIterator: TypeAlias = Iterator[GraphQLReturnType] | Generator[GraphQLReturnType, None, None]
+AsyncGraphQLReturnTypeIterator: TypeAlias = AsyncIterator[GraphQLReturnType] | AsyncGenerator[GraphQLReturnType, None]
+GraphQLAnyReturnType: TypeAlias = GraphQLReturnType | GraphQLReturnTypeIterator | AsyncGraphQLReturnTypeIterator
+GraphQLContextType: TypeAlias = Any
+GraphQLRootType: TypeAlias = Any
 
-GraphQLData = Optional[dict[str, JSON]]
-GraphQLErrors = Optional[list[dict[str, JSON]]]
-GraphQLExtensions = Optional[list[dict[str, JSON]]]
+GraphQLData: TypeAlias = dict[str, JSON] | None
+GraphQLErrors: TypeAlias = list[dict[str, JSON]] | None
+GraphQLExtensions: TypeAlias = list[dict[str, JSON]] | None
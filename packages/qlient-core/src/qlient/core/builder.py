@@ -225,7 +225,7 @@ class RequestBuilder:
 
         #
         if _fields and isinstance(_fields, PreparedFields):
-            query_builder.fields(_fields.__gql__())
+            query_builder.fields(_fields.render())
 
         # add the variables from the input
         for key in _inputs:
@@ -8,6 +8,8 @@ class QlientException(Exception):
 class SchemaException(QlientException):
     """Indicates that something is wrong regarding the graphql schema."""
 
+    __slots__ = ("schema",)
+
     def __init__(self, schema: dict, *args):
         self.schema: dict = schema
         super().__init__(*args)
@@ -19,10 +21,14 @@ class SchemaParseException(SchemaException):
     This exception gets thrown when the parser was unable to parse the graphql schema
     """
 
+    __slots__ = ()
+
 
 class NoTypesFound(SchemaParseException):
     """Indicates that the schema does not have any types defined."""
 
+    __slots__ = ()
+
 
 class OutOfAsyncContext(QlientException):
     """Indicates that you are running out of an async context."""
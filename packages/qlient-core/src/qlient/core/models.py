@@ -1,5 +1,8 @@
 """This module contains the qlient models."""
 
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Iterator, Sequence
 from typing import Any, Optional
 
 from qlient.core._types import (
@@ -18,13 +21,42 @@ from qlient.core.schema.models import Field as SchemaField
 from qlient.core.schema.models import Type as SchemaType
 from qlient.core.schema.schema import Schema
 
+# the number of prepared selections that are cached per schema
+PREPARED_FIELDS_CACHE_SIZE = 1024
+
+# guards the prepared selection caches of all schemas, sync clients may share a schema between threads
+_PREPARED_FIELDS_LOCK = threading.Lock()
+
+# the interned directives by class and name, see `Directive`
+_DIRECTIVE_POOL: dict[tuple[type, str], "Directive"] = {}
+
+# selected fields are keyed by their alias, name and directive, see `Fields._select`
+_FieldKey = tuple[str | None, str, Optional["Directive"]]
+
 
 class Directive:
-    """Class to create a directive on a Field."""
+    """Class to create a directive on a Field.
+
+    Directives only consist of their name, so they are interned:
+    creating a directive with the same name again returns the same instance.
+    """
+
+    __slots__ = ("name",)
+
+    def __new__(cls, _name: str) -> "Directive":
+        key = (cls, _name)
+        directive = _DIRECTIVE_POOL.get(key)
+        if directive is None:
+            directive = _DIRECTIVE_POOL[key] = super().__new__(cls)
+        return directive
 
     def __init__(self, _name: str):
         self.name: str = _name
 
+    def __reduce__(self):
+        # __new__ requires the name, copies and unpickled directives go through the pool as well
+        return self.__class__, (self.name,)
+
     def prepare(self, schema: Schema) -> "PreparedDirective":
         """Prepare this directive and return a ref:`PreparedDirective`
 
@@ -44,10 +76,10 @@ class Directive:
     def __hash__(self) -> int:
         return hash(self.name)
 
-    def __eq__(self, other):
-        if not isinstance(other, self.__class__):
-            raise TypeError(f"Can not compare other classes than {self.__class__.__name__}")
-        return hash(self) == hash(other)
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.name == other.name
 
 
 class PreparedDirective:
@@ -56,6 +88,8 @@ class PreparedDirective:
     There should be no more changes made on this directive.
     """
 
+    __slots__ = ("schema_directive", "name")
+
     def __init__(self):
         # the graphql schema directive type
         self.schema_directive: SchemaDirective | None = None
@@ -118,9 +152,9 @@ class PreparedDirective:
     def __hash__(self) -> int:
         return hash(self.name)
 
-    def __eq__(self, other):
-        if not isinstance(other, self.__class__):
-            raise TypeError(f"Can not compare other classes than {self.__class__.__name__}")
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
         return hash(self) == hash(other)
 
 
@@ -131,6 +165,8 @@ class Field:
     class.
     """
 
+    __slots__ = ("name", "alias", "directive", "sub_fields", "_hash")
+
     def __init__(
         self,
         _name: str,
@@ -142,20 +178,17 @@ class Field:
         self.alias: str | None = _alias
         self.directive: Directive | None = _directive
         self.sub_fields: Optional["Fields"] = Fields(_sub_fields) if _sub_fields is not None else None
+        # the hash walks the whole sub selection, compute it only once
+        self._hash: int | None = None
 
-    def __and__(self, other) -> "Fields":
+    def __and__(self, other: Any) -> "Fields":
         return self.__add__(other)
 
-    def __add__(self, other) -> "Fields":
-        if isinstance(other, (str, self.__class__)):
-            other = Fields(other)
-        if isinstance(other, (list, tuple, set)):
-            other = Fields(*other)
-        if isinstance(other, dict):
-            other = Fields(**other)
-        if isinstance(other, Fields):
-            return Fields(self) + other
-        raise TypeError(f"Can not handle type `{type(other)}`")
+    def __add__(self, other: Any) -> "Fields":
+        other_fields = _as_fields(Fields, other)
+        if other_fields is None:
+            raise TypeError(f"Can not handle type `{type(other)}`")
+        return Fields(self) + other_fields
 
     def prepare(
         self,
@@ -183,12 +216,19 @@ class Field:
         return p
 
     def __hash__(self) -> int:
-        return hash((self.alias, self.name, self.directive, self.sub_fields))
-
-    def __eq__(self, other):
-        if not isinstance(other, self.__class__):
-            raise TypeError(f"Can not compare other classes than {self.__class__.__name__}")
-        return hash(self) == hash(other)
+        if self._hash is None:
+            self._hash = hash((self.alias, self.name, self.directive, self.sub_fields))
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # the cached hashes rule out most unequal fields before the selections are compared
+        return self is other or (
+            hash(self) == hash(other)
+            and (self.alias, self.name, self.directive, self.sub_fields)
+            == (other.alias, other.name, other.directive, other.sub_fields)
+        )
 
 
 class PreparedField:
@@ -197,6 +237,19 @@ class PreparedField:
     This means that there should be no more changes made to this field.
     """
 
+    __slots__ = (
+        "parent_type",
+        "field_type",
+        "name",
+        "alias",
+        "directive",
+        "sub_fields",
+        "_alias_prefix",
+        "_directive_suffix",
+        "_hash",
+        "_gql",
+    )
+
     def __init__(self):
         # the field parent type
         self.parent_type: SchemaType | None = None
@@ -210,6 +263,50 @@ class PreparedField:
         self.directive: PreparedDirective | None = None
         # a sub selection of fields of this type
         self.sub_fields: PreparedFields | None = None
+        # the parts of the graphql representation around the name
+        self._alias_prefix: str = ""
+        self._directive_suffix: str = ""
+        # the cached hash and graphql representation, reset on every preparation
+        self._hash: int | None = None
+        self._gql: str | None = None
+
+    @classmethod
+    def from_validated(
+        cls,
+        parent_type: SchemaType,
+        field_type: SchemaField,
+        name: str,
+        alias: str | None = None,
+        directive: PreparedDirective | None = None,
+        sub_fields: Optional["PreparedFields"] = None,
+    ) -> "PreparedField":
+        """Class method to create a prepared field from parts that were validated already.
+
+        Unlike `prepare`, nothing is looked up or validated again.
+
+        Args:
+            parent_type: holds the parent schema type of this field
+            field_type: holds the schema field of this field
+            name: holds the name of this field
+            alias: holds the alias of this field
+            directive: holds the prepared directive of this field
+            sub_fields: holds the prepared sub selection of this field
+
+        Returns:
+            the prepared field
+        """
+        p = cls.__new__(cls)
+        p.parent_type = parent_type
+        p.field_type = field_type
+        p.name = name
+        p.alias = alias
+        p.directive = directive
+        p.sub_fields = sub_fields
+        p._alias_prefix = f"{alias}: " if alias else ""
+        p._directive_suffix = f" {directive.__gql__()}" if directive is not None else ""
+        p._hash = None
+        p._gql = None
+        return p
 
     def prepare(
         self,
@@ -230,6 +327,8 @@ class PreparedField:
             directive: holds a directive that should be used on this field
             sub_fields: holds a selection of sub_fields for this field
         """
+        self._hash = None
+        self._gql = None
         self.prepare_name(name, alias)
         self.prepare_type_checking(parent_type)
         self.prepare_directive(schema, directive)
@@ -246,8 +345,12 @@ class PreparedField:
             raise ValueError("Directive name must have a value.")
         self.name = name
         self.alias = alias
+        self._alias_prefix = f"{alias}: " if alias else ""
 
-    def prepare_type_checking(self, parent_type: SchemaType):
+    def prepare_type_checking(
+        self,
+        parent_type: SchemaType,
+    ):
         """Method to prepare this field for type checking.
 
         Args:
@@ -256,7 +359,7 @@ class PreparedField:
         if not self.name:
             raise ValueError(f"Name must be set before " f"calling `{self.prepare_type_checking.__name__}`")
         self.parent_type = parent_type
-        schema_field_type = parent_type.field_name_to_field.get(self.name)
+        schema_field_type = parent_type.resolve_field(self.name)
         if schema_field_type is None:
             raise ValueError(f"No Field found with name `{self.name}` in schema.")
         self.field_type = schema_field_type
@@ -269,8 +372,10 @@ class PreparedField:
             directive: holds the actual directive to be prepared
         """
         if directive is None:
+            self._directive_suffix = ""
             return
         self.directive = directive.prepare(schema)
+        self._directive_suffix = f" {self.directive.__gql__()}"
 
     def prepare_sub_fields(
         self,
@@ -294,19 +399,21 @@ class PreparedField:
         Returns:
             a string with the graphql representation of this field
         """
-        builder = f"{f'{self.alias}: ' if self.alias else ''}{self.name}"
-        if self.directive is not None:
-            builder += f" {self.directive.__gql__()}"
-        if self.sub_fields is not None:
-            builder += f" {{ {self.sub_fields.__gql__()} }}"
-        return builder
+        if self._gql is None:
+            gql = self._alias_prefix + self.name + self._directive_suffix
+            if self.sub_fields is not None:
+                gql = f"{gql} {{ {self.sub_fields.__gql__()} }}"
+            self._gql = gql
+        return self._gql
 
     def __hash__(self) -> int:
-        return hash((self.alias, self.name, self.directive, self.sub_fields))
+        if self._hash is None:
+            self._hash = hash((self.alias, self.name, self.directive, self.sub_fields))
+        return self._hash
 
-    def __eq__(self, other):
-        if not isinstance(other, self.__class__):
-            raise TypeError(f"Can not compare other classes than {self.__class__.__name__}")
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
         return hash(self) == hash(other)
 
 
@@ -316,12 +423,39 @@ class Fields:
     Use this class to create a selection of multiple fields or combine multiple instances.
     """
 
+    __slots__ = ("selected_fields", "_by_key", "_hash")
+
+    @staticmethod
+    def _select(fields: dict[_FieldKey, Field], field: Field):
+        """Static method to add a field to the fields selected so far.
+
+        A field selected again under the same alias, name and directive is merged with the earlier one,
+        the same way the server merges them: the sub selections of both are combined.
+        Fields that only differ in their directive are both kept.
+
+        Args:
+            fields: holds the fields selected so far, mapped by their alias, name and directive
+            field: holds the field to add
+        """
+        key = (field.alias, field.name, field.directive)
+        selected = fields.get(key)
+        if selected is not None and selected != field:
+            if selected.sub_fields is None:
+                sub_fields = field.sub_fields
+            elif field.sub_fields is None:
+                sub_fields = selected.sub_fields
+            else:
+                sub_fields = selected.sub_fields + field.sub_fields
+            field = Field(field.name, field.alias, field.directive, sub_fields)
+        # an existing key keeps its position
+        fields[key] = field
+
     @classmethod
     def parse_args(
         cls,
-        args: tuple[Any],
-        fields: dict[int, Field] = None,
-    ) -> dict[int, Field]:
+        args: tuple[Any, ...],
+        fields: dict[_FieldKey, Field] | None = None,
+    ) -> dict[_FieldKey, Field]:
         """Class method to parse given *args.
 
         Args:
@@ -330,7 +464,8 @@ class Fields:
                     empty dict if None
 
         Returns:
-            a dictionary mapped with the hash of the field to the Field itself.
+            a dictionary mapped with the (alias, name, directive) of the field to the Field itself.
+            A field selected again is merged with the earlier one, see :meth:`_select`.
         """
         fields = fields or {}
         for arg in args:
@@ -340,7 +475,7 @@ class Fields:
                     continue
                 arg = Field(arg)
             if isinstance(arg, Field):
-                fields[hash(arg)] = arg
+                cls._select(fields, arg)
                 continue
             if isinstance(arg, (list, tuple, set)):
                 arg = cls(*arg)
@@ -348,7 +483,7 @@ class Fields:
                 arg = cls(**arg)
             if isinstance(arg, cls):
                 for field in arg.selected_fields:
-                    fields[hash(field)] = field
+                    cls._select(fields, field)
                 continue
             raise TypeError(f"Can't handle type `{type(arg).__name__}`")
 
@@ -358,8 +493,8 @@ class Fields:
     def parse_kwargs(
         cls,
         kwargs: dict[Any, Any],
-        fields: dict[int, Field] = None,
-    ) -> dict[int, Field]:
+        fields: dict[_FieldKey, Field] | None = None,
+    ) -> dict[_FieldKey, Field]:
         """Class method to parse given **kwargs.
 
         Args:
@@ -368,28 +503,51 @@ class Fields:
                     empty dict if None
 
         Returns:
-            a dictionary mapped with the hash of the field to the Field itself.
+            a dictionary mapped with the (alias, name, directive) of the field to the Field itself.
+            A field selected again is merged with the earlier one, see :meth:`_select`.
         """
         fields = fields or {}
         for key, value in kwargs.items():
-            field = Field(key, _sub_fields=cls(value))
-            fields[hash(field)] = field
+            cls._select(fields, Field(key, _sub_fields=value))
         return fields
 
+    @classmethod
+    def _from_dict(cls, by_key: dict[_FieldKey, Field]) -> "Fields":
+        """Class method to create an instance from already parsed fields without parsing them again.
+
+        Args:
+            by_key: holds the fields mapped by their (alias, name, directive), the instance takes ownership of it
+
+        Returns:
+            a new instance of this class
+        """
+        instance = cls.__new__(cls)
+        instance._by_key = by_key
+        instance.selected_fields = tuple(by_key.values())
+        instance._hash = None
+        return instance
+
     def __init__(self, *args, **kwargs):
-        _fields: dict[int, Field] = {}
+        _fields: dict[_FieldKey, Field] = {}
 
         _fields = self.parse_args(args, _fields)
         _fields = self.parse_kwargs(kwargs, _fields)
 
-        self.selected_fields: list[Field] = list(_fields.values())
+        # the selected fields by (alias, name, directive) for constant time membership checks
+        self._by_key: dict[_FieldKey, Field] = _fields
+        # fields are never changed after parsing, adding them returns a new instance
+        self.selected_fields: tuple[Field, ...] = tuple(_fields.values())
+        self._hash: int | None = None
 
-    def __contains__(self, item) -> bool:
+    def __contains__(self, item: object) -> bool:
         if isinstance(item, str):
-            item = Field(item)
-        return item in self.selected_fields
+            return (None, item, None) in self._by_key
+        if isinstance(item, Field):
+            field = self._by_key.get((item.alias, item.name, item.directive))
+            return field is not None and field == item
+        return False
 
-    def __and__(self, other) -> "Fields":
+    def __and__(self, other: Any) -> "Fields":
         """Synthetic sugar method which essentially just does the __add__
 
         Args:
@@ -400,39 +558,41 @@ class Fields:
         """
         return self.__add__(other)
 
-    def __add__(self, other) -> "Fields":
+    def __add__(self, other: Any) -> "Fields":
         """Add another object to this fields.
 
         Args:
             other: the object to add
 
         Returns:
-            a new instance of this class with the added fields
+            a new instance of this class with the added fields,
+            this instance itself if there is nothing to add
         """
+        if other is None or (isinstance(other, (Fields, str, list, tuple, set, dict)) and not other):
+            # fields never change after parsing, nothing to add means nothing to copy
+            return self
         cls = self.__class__
-        if other is None:
-            return cls(*self.selected_fields)
-        if isinstance(other, (str, Field)):
-            other = cls(other)
-        if isinstance(other, (list, tuple, set)):
-            other = cls(*other)
-        if isinstance(other, dict):
-            other = cls(**other)
-        if isinstance(other, cls):
-            args = [*self.selected_fields, *other.selected_fields]
-            return cls(*args)
-        raise TypeError(f"Can not add {other} to {self}")
-
-    def __eq__(self, other):
-        if not isinstance(other, self.__class__):
-            raise TypeError(f"Can not compare other classes than {self.__class__.__name__}")
-        return hash(self) == hash(other)
+        other_fields = _as_fields(cls, other)
+        if other_fields is None:
+            raise TypeError(f"Can not add {other} to {self}")
+        # both sides are parsed already, merge them the same way parsing would
+        by_key = dict(self._by_key)
+        for field in other_fields.selected_fields:
+            cls._select(by_key, field)
+        return cls._from_dict(by_key)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self is other or (hash(self) == hash(other) and self.selected_fields == other.selected_fields)
 
     def __bool__(self) -> bool:
         return bool(self.selected_fields)
 
     def __hash__(self) -> int:
-        return hash(tuple(self.selected_fields))
+        if self._hash is None:
+            self._hash = hash(self.selected_fields)
+        return self._hash
 
     def prepare(
         self,
@@ -441,6 +601,9 @@ class Fields:
     ) -> "PreparedFields":
         """Method to convert this fields instance into a PreparedFields instance.
 
+        The same selection is usually prepared over and over again,
+        so the last `PREPARED_FIELDS_CACHE_SIZE` prepared selections are kept on the schema.
+
         Args:
             parent_type: holds the parent type of this Field
             schema: holds the schema that should be used for validation
@@ -448,12 +611,25 @@ class Fields:
         Returns:
             a PreparedFields instance
         """
+        cache = schema.prepared_fields_cache
+        key = (id(parent_type), self)
+        with _PREPARED_FIELDS_LOCK:
+            p = cache.get(key)
+            if p is not None:
+                cache.move_to_end(key)
+                return p
+
+        # prepared outside the lock, the sub selections are looked up in the cache as well
         p = PreparedFields()
         p.prepare(
             parent_type=parent_type,
             schema=schema,
             fields=self.selected_fields,
         )
+        with _PREPARED_FIELDS_LOCK:
+            cache[key] = p
+            if len(cache) > PREPARED_FIELDS_CACHE_SIZE:
+                cache.popitem(last=False)
         return p
 
 
@@ -463,15 +639,20 @@ class PreparedFields:
     A prepared class should not be changed after preparation.
     """
 
+    __slots__ = ("fields", "_hash", "_gql")
+
     def __init__(self):
         # the prepared fields
         self.fields: list[PreparedField] | None = None
+        # the cached hash and graphql representation, reset on every preparation
+        self._hash: int | None = None
+        self._gql: str | None = None
 
     def prepare(
         self,
         parent_type: SchemaType,
         schema: Schema,
-        fields: list[Field] | None = None,
+        fields: Sequence[Field] | None = None,
     ):
         """Method to prepare this instance after initialization.
 
@@ -480,29 +661,50 @@ class PreparedFields:
             schema: holds the schema to use for validation and type lookups.
             fields: holds the list of fields that were selected
         """
+        self._hash = None
+        self._gql = None
         self.prepare_fields(parent_type, schema, fields)
+        # compile the selection right away, see `render`
+        self.__gql__()
 
     def prepare_fields(
         self,
         parent_type: SchemaType,
         schema: Schema,
-        fields: list[Fields] | None,
+        fields: Sequence[Field] | None,
     ):
         """Method to turn all selected fields into prepared fields.
 
+        The nested selections are prepared level by level from a work list,
+        instead of descending recursively through `Field.prepare` for every sub selection.
+
         Args:
             parent_type: holds this fields instance parents field schema type.
             schema: holds the schema to use for validation and type lookups.
             fields: holds a list of fields that should be prepared
         """
-        fields: list[Field] = fields if fields is not None else []
-        self.fields = [
-            field.prepare(
-                parent_type,
-                schema,
-            )
-            for field in fields
-        ]
+        work: deque[tuple[SchemaType, Sequence[Field], PreparedFields]] = deque()
+        work.append((parent_type, fields if fields is not None else [], self))
+        while work:
+            parent_type, fields, prepared_fields = work.popleft()
+            # the mapping is cached on the schema type itself
+            field_name_to_field = parent_type.field_name_to_field
+            prepared: list[PreparedField] = []
+            for field in fields:
+                field_type = field_name_to_field.get(field.name)
+                if field_type is None:
+                    raise ValueError(f"No Field found with name `{field.name}` in schema.")
+                directive = field.directive.prepare(schema) if field.directive is not None else None
+                # the sub selection is filled in once its level is processed
+                sub_fields = PreparedFields() if field.sub_fields is not None else None
+                prepared.append(
+                    PreparedField.from_validated(
+                        parent_type, field_type, field.name, field.alias, directive, sub_fields
+                    )
+                )
+                if sub_fields is not None:
+                    work.append((field_type.type.leaf_type, field.sub_fields.selected_fields, sub_fields))
+            prepared_fields.fields = prepared
 
     def __gql__(self) -> str:
         """Method to create a graphql representation of this fields instance.
@@ -510,17 +712,82 @@ class PreparedFields:
         Returns:
             a string with the graphql representation of this fields instance
         """
-        return " ".join(field.__gql__() for field in self.fields)
+        if self._gql is None:
+            self._gql = " ".join([field.__gql__() for field in self.fields])
+        return self._gql
+
+    def render(self) -> str:
+        """Method to get the compiled graphql representation of this fields instance.
+
+        The selection is rendered once when it is prepared,
+        rendering it again does not walk the prepared fields anymore.
+
+        Returns:
+            a string with the graphql representation of this fields instance
+        """
+        return self._gql if self._gql is not None else self.__gql__()
 
     def __hash__(self) -> int:
-        return hash(tuple(self.fields))
+        if self._hash is None:
+            self._hash = hash(tuple(self.fields))
+        return self._hash
 
-    def __eq__(self, other):
-        if not isinstance(other, self.__class__):
-            raise TypeError(f"Can not compare other classes than {self.__class__.__name__}")
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
         return hash(self) == hash(other)
 
 
+def _fields_from_fields(_: type[Fields], other: Fields) -> Fields:
+    return other
+
+
+def _fields_from_single(cls: type[Fields], other: str | Field) -> Fields:
+    return cls(other)
+
+
+def _fields_from_iterable(cls: type[Fields], other: list | tuple | set) -> Fields:
+    return cls(*other)
+
+
+def _fields_from_mapping(cls: type[Fields], other: dict) -> Fields:
+    return cls(**other)
+
+
+# the types that can be added to fields, in order of precedence for subclasses
+_FIELDS_CONVERTERS = (
+    (Fields, _fields_from_fields),
+    ((str, Field), _fields_from_single),
+    ((list, tuple, set), _fields_from_iterable),
+    (dict, _fields_from_mapping),
+)
+# the same converters by exact type, for a single lookup in the common case
+_FIELDS_CONVERTER_BY_TYPE = {
+    _type: converter
+    for types, converter in _FIELDS_CONVERTERS
+    for _type in (types if isinstance(types, tuple) else (types,))
+}
+
+
+def _as_fields(cls: type[Fields], other: Any) -> Fields | None:
+    """Convert the other operand of an addition to a Fields instance.
+
+    Args:
+        cls: holds the Fields class to create new instances of
+        other: holds the object to convert
+
+    Returns:
+        the Fields instance, None if the object can not be converted
+    """
+    converter = _FIELDS_CONVERTER_BY_TYPE.get(type(other))
+    if converter is None:
+        # fall back to isinstance for subclasses of the supported types
+        converter = next((c for types, c in _FIELDS_CONVERTERS if isinstance(other, types)), None)
+        if converter is None:
+            return None
+    return converter(cls, other)
+
+
 class GraphQLRequest:
     """Represents the graphql request."""
 
@@ -547,7 +814,7 @@ class GraphQLSubscriptionRequest(GraphQLRequest):
     subscription_id: str
     options: dict[str, Any]
 
-    def __init__(self, subscription_id: str = None, options: dict[str, Any] = None, **kwargs):
+    def __init__(self, subscription_id: str | None = None, options: dict[str, Any] | None = None, **kwargs):
         super().__init__(**kwargs)
         if options is None:
             options = {}
@@ -558,6 +825,8 @@ class GraphQLSubscriptionRequest(GraphQLRequest):
 class GraphQLResponse:
     """Represents the graphql response type."""
 
+    __slots__ = ("request", "raw", "data", "errors", "extensions", "__weakref__")
+
     def __init__(
         self,
         request: GraphQLRequest,
@@ -566,21 +835,20 @@ class GraphQLResponse:
         self.request: GraphQLRequest = request
         self.raw: GraphQLAnyReturnType = response
 
-        self.data = None
-        self.errors = None
-        self.extensions = None
-
-        if isinstance(self.raw, dict):
+        if isinstance(response, dict):
             # response parsing
-            self.data: GraphQLData = self.raw.get("data")
-            self.errors: GraphQLErrors = self.raw.get("errors")
-            self.extensions: GraphQLExtensions = self.raw.get("extensions")
-
-    def __iter__(self):
+            self.data: GraphQLData = response.get("data")
+            self.errors: GraphQLErrors = response.get("errors")
+            self.extensions: GraphQLExtensions = response.get("extensions")
+        else:
+            # subscriptions hold an iterator of responses
+            self.data = self.errors = self.extensions = None
+
+    def __iter__(self) -> Iterator[Any]:
         # for a synchronous subscription
         return iter(self.raw)
 
-    def __aiter__(self):
+    def __aiter__(self) -> AsyncIterator[Any]:
         # for an asynchronous subscription
         return self.raw.__aiter__()
 
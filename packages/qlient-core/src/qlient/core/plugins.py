@@ -32,6 +32,8 @@ class Plugin:
 def apply_pre(plugins: list[Plugin], request: GraphQLRequest) -> GraphQLRequest:
     """Helper function to apply all pre plugins.
 
+    Plugins that do not override `Plugin.pre` are skipped.
+
     Args:
         plugins: the list of plugins to apply
         request: the graphql request instance
@@ -40,13 +42,18 @@ def apply_pre(plugins: list[Plugin], request: GraphQLRequest) -> GraphQLRequest:
         the graphql request instance
     """
     for plugin in plugins:
-        request = plugin.pre(request)
+        pre = plugin.pre
+        # compare the underlying function, hooks set on the instance are no bound methods
+        if getattr(pre, "__func__", None) is not Plugin.pre:
+            request = pre(request)
     return request
 
 
 def apply_post(plugins: list[Plugin], response: GraphQLResponse) -> GraphQLResponse:
     """Helper function to apply all post plugins.
 
+    Plugins that do not override `Plugin.post` are skipped.
+
     Args:
         plugins: the list of plugins to apply
         response: the graphql response instance
@@ -55,5 +62,8 @@ def apply_post(plugins: list[Plugin], response: GraphQLResponse) -> GraphQLRespo
         the graphql response instance
     """
     for plugin in plugins:
-        response = plugin.post(response)
+        post = plugin.post
+        # compare the underlying function, hooks set on the instance are no bound methods
+        if getattr(post, "__func__", None) is not Plugin.post:
+            response = post(response)
     return response
@@ -2,6 +2,7 @@
 
 import enum
 import logging
+import sys
 from typing import Any, Optional, Union
 
 logger = logging.getLogger("qlient")
@@ -20,9 +21,52 @@ class Kind(enum.Enum):
     UNION = "UNION"
 
 
+# calling the enum class is slow, look the kinds up by value (or by themselves) instead
+_KIND_CACHE: dict[str | Kind, Kind] = {**{kind.value: kind for kind in Kind}, **{kind: kind for kind in Kind}}
+
+
+def _to_kind(kind: str | Kind | None) -> Kind | None:
+    """Convert the given kind value to the Kind enum.
+
+    Args:
+        kind: holds the kind value (or Kind)
+
+    Returns:
+        the Kind, None if no kind was given
+
+    Raises:
+        ValueError: when the kind value is not a valid Kind
+    """
+    if not kind:
+        return None
+    return _KIND_CACHE.get(kind) or Kind(kind)
+
+
+def _build_list(cls: type, items: list | None) -> list:
+    """Build a list of schema models from their introspection dictionaries.
+
+    Introspection results are plain dictionaries, those are passed to the model directly.
+    Anything else goes through `cls.parse` to be validated.
+    The introspection never lists empty items, so the items are not filtered.
+
+    Args:
+        cls: holds the schema model class to build
+        items: holds the dictionaries (or already built models) to build from
+
+    Returns:
+        a list of schema models
+    """
+    if not items:
+        return []
+    parse = cls.parse
+    return [cls(**item) if item.__class__ is dict else parse(item) for item in items]
+
+
 class TypeRef:
     """Represents a basic graphql Type Reference."""
 
+    __slots__ = ("kind", "name", "of_type_ref", "type", "_leaf_ref", "_gql", "_repr")
+
     kind: Kind | None
     name: str | None
     of_type_ref: Optional["TypeRef"]
@@ -39,7 +83,7 @@ class TypeRef:
             the parsed type ref
         """
         if isinstance(type_ref, dict):
-            type_ref = cls(**type_ref)
+            return cls(**type_ref)
         if not isinstance(type_ref, cls):
             raise TypeError(f"Expected dict, {cls.__name__} got {type(type_ref)}")
         return type_ref
@@ -54,7 +98,7 @@ class TypeRef:
         Returns:
             a list of type_refs
         """
-        return [cls.parse(type_ref) for type_ref in type_refs if type_ref] if type_refs else []
+        return _build_list(cls, type_refs)
 
     def __init__(
         self,
@@ -62,37 +106,53 @@ class TypeRef:
         name: str | None = None,
         ofType: Optional["TypeRef"] = None,  # noqa
     ):
-        self.kind = Kind(kind) if kind else None
-        self.name = name
-        self.of_type_ref = self.parse(ofType) if ofType else None
+        self.kind = _to_kind(kind)
+        # the same few type names are referenced all over the schema
+        self.name = sys.intern(name) if name else name
+        if ofType:
+            self.of_type_ref = TypeRef(**ofType) if ofType.__class__ is dict else self.parse(ofType)
+        else:
+            self.of_type_ref = None
         self.type: Optional["Type"] = None  # skipcq: PYL-W0622
-
-    def __str__(self) -> str:
-        """Return a simple string representation of the type ref instance."""
-        return repr(self)
+        # the of_type_ref is parsed first, so its leaf is already known
+        self._leaf_ref: "TypeRef" = self if self.of_type_ref is None else self.of_type_ref._leaf_ref
+        # the string representations never change, they are built on first use
+        self._gql: str | None = None
+        self._repr: str | None = None
 
     def __repr__(self) -> str:
         """Return a more detailed string representation of the type ref instance."""
-        class_name = self.__class__.__name__
-        return f"<{class_name}(" f"kind=`{self.kind.name}`, " f"name=`{self.name}`, " f"ofType={self.of_type_ref}" ")>"
+        if self._repr is None:
+            class_name = self.__class__.__name__
+            self._repr = (
+                f"<{class_name}(" f"kind=`{self.kind.name}`, " f"name=`{self.name}`, " f"ofType={self.of_type_ref}" ")>"
+            )
+        return self._repr
+
+    __str__ = __repr__
 
     def __gql__(self) -> str:
+        if self._gql is not None:
+            return self._gql
         representation = self.of_type_ref.graphql_representation if self.of_type_ref is not None else self.name
-        if self.kind == Kind.NON_NULL:
+        # the kinds are enum singletons, compare them by identity
+        if self.kind is Kind.NON_NULL:
             representation = f"{representation}!"
-        if self.kind == Kind.LIST:
+        elif self.kind is Kind.LIST:
             representation = f"[{representation}]"
+        self._gql = representation
         return representation
 
     def infer_type_refs(self, types_dict: dict[str, "Type"]):
-        """Method to recursively infer types down to the deepest type level.
+        """Method to infer types down to the deepest type level.
 
         Args:
             types_dict: holds the mapping of type name to type
         """
-        self.type = types_dict.get(self.name)
-        if self.of_type_ref is not None:
-            self.of_type_ref.infer_type_refs(types_dict)
+        type_ref = self
+        while type_ref is not None:
+            type_ref.type = types_dict.get(type_ref.name)
+            type_ref = type_ref.of_type_ref
 
     @property
     def graphql_representation(self) -> str:
@@ -103,19 +163,20 @@ class TypeRef:
         Returns:
             the graphql type representation for this.
         """
-        return self.__gql__()
+        gql = self._gql
+        return gql if gql is not None else self.__gql__()
 
     @property
     def leaf_type_name(self) -> str | None:
         """Property to return the name of the very last (leaf) `of_type`
 
-        As long as the `of_type` property is not None,
-        it will call the `leaf_type_name` property of the `of_type`.
+        The leaf type ref is looked up once when the type ref is created,
+        so this does not walk the `of_type` chain.
 
         Returns:
             The name of the very last (leaf) `of_type` Type Ref.
         """
-        return self.name if self.of_type_ref is None else self.of_type_ref.leaf_type_name
+        return self._leaf_ref.name
 
     @property
     def leaf_type(self) -> Optional["Type"]:
@@ -124,12 +185,14 @@ class TypeRef:
         Returns:
             The type of the very last (leaf) `of_type`
         """
-        return self.type if self.of_type_ref is None else self.of_type_ref.leaf_type
+        return self._leaf_ref.type
 
 
 class Input:
     """Represents a basic graphql Input."""
 
+    __slots__ = ("name", "description", "type", "default_value")
+
     name: str | None
     description: str | None
     type: TypeRef | None  # skipcq: PYL-W0622
@@ -146,7 +209,7 @@ class Input:
             the parsed input
         """
         if isinstance(input_value, dict):
-            input_value = cls(**input_value)
+            return cls(**input_value)
         if not isinstance(input_value, cls):
             raise TypeError(f"Expected dict, {cls.__name__} got {type(input_value)}")
         return input_value
@@ -161,7 +224,7 @@ class Input:
         Returns:
             a list of inputs
         """
-        return [cls.parse(input_value) for input_value in inputs if input_value] if inputs else []
+        return _build_list(cls, inputs)
 
     def __init__(
         self,
@@ -173,22 +236,25 @@ class Input:
     ):
         self.name = name
         self.description = description
-        self.type = TypeRef.parse(type) if type else None
+        if type:
+            self.type = TypeRef(**type) if type.__class__ is dict else TypeRef.parse(type)
+        else:
+            self.type = None
         self.default_value = defaultValue
 
-    def __str__(self) -> str:
-        """Return a simple string representation of the input instance."""
-        return repr(self)
-
     def __repr__(self) -> str:
         """Return a more detailed string representation of the input instance."""
         class_name = self.__class__.__name__
         return f"<{class_name}(name=`{self.name}`, type={self.type})>"
 
+    __str__ = __repr__
+
 
 class Directive:
     """Represents a basic graphql Directive."""
 
+    __slots__ = ("name", "description", "locations", "args", "_arg_name_to_arg")
+
     name: str | None
     description: str | None
     locations: list[str] | None
@@ -205,7 +271,7 @@ class Directive:
             the parsed directive
         """
         if isinstance(directive, dict):
-            directive = cls(**directive)
+            return cls(**directive)
         if not isinstance(directive, cls):
             raise TypeError(f"Expected dict, {cls.__name__} got {type(directive)}")
         return directive
@@ -220,7 +286,7 @@ class Directive:
         Returns:
             a list of directives
         """
-        return [cls.parse(directive) for directive in directives if directive] if directives else []
+        return _build_list(cls, directives)
 
     def __init__(
         self,
@@ -232,30 +298,45 @@ class Directive:
         self.name: str | None = name
         self.description: str | None = description
         self.locations: list[str] | None = locations
-        self.args: list[Input] = Input.parse_list(args)
+        self.args: list[Input] = _build_list(Input, args)
+        # built on first access, see `arg_name_to_arg`
+        self._arg_name_to_arg: dict[str, Input] | None = None
 
     @property
     def arg_name_to_arg(self) -> dict[str, Input]:
         """Property for mapping the argument name to the argument for faster lookups.
 
+        The mapping is built once on first access, the schema does not change after parsing.
+
         Returns:
             A dictionary where the argument name is mapped to the argument itself
         """
-        return {arg.name: arg for arg in self.args}
-
-    def __str__(self) -> str:
-        """Return a simple string representation of the directive instance."""
-        return repr(self)
+        if self._arg_name_to_arg is None:
+            self._arg_name_to_arg = {arg.name: arg for arg in self.args}
+        return self._arg_name_to_arg
 
     def __repr__(self) -> str:
         """Return a more detailed string representation of the directive instance."""
         class_name = self.__class__.__name__
         return f"<{class_name}(name=`{self.name}`, locations={self.locations})>"
 
+    __str__ = __repr__
+
 
 class Field:
     """Represents a basic graphql Field."""
 
+    __slots__ = (
+        "name",
+        "description",
+        "args",
+        "type",
+        "is_deprecated",
+        "deprecation_reason",
+        "_arg_name_to_arg",
+        "_leaf_ref",
+    )
+
     name: str | None
     description: str | None
     args: list[Input] | None
@@ -274,7 +355,7 @@ class Field:
             the parsed field
         """
         if isinstance(field, dict):
-            field = cls(**field)
+            return cls(**field)
         if not isinstance(field, cls):
             raise TypeError(f"Expected dict, {cls.__name__} got {type(field)}")
         return field
@@ -289,7 +370,7 @@ class Field:
         Returns:
             a list of fields
         """
-        return [cls.parse(field) for field in fields if field] if fields else []
+        return _build_list(cls, fields)
 
     def __init__(
         self,
@@ -301,36 +382,50 @@ class Field:
         isDeprecated: bool | None = None,  # noqa
         deprecationReason: str | None = None,  # noqa
     ):
-        self.name: str | None = name
+        self.name: str | None = sys.intern(name) if name else name
         self.description: str | None = description
-        self.args: list[Input] = Input.parse_list(args)
-        self.type: TypeRef | None = TypeRef.parse(type) if type else None  # skipcq: PYL-W0622
+        self.args: list[Input] = _build_list(Input, args)
+        if type:
+            self.type: TypeRef | None = TypeRef(**type) if type.__class__ is dict else TypeRef.parse(type)
+        else:
+            self.type: TypeRef | None = None  # skipcq: PYL-W0622
         self.is_deprecated: bool | None = isDeprecated
         self.deprecation_reason: str | None = deprecationReason
-
-    def __str__(self) -> str:
-        """Return a simple string representation of the field instance."""
-        return repr(self)
+        # built on first access, see `arg_name_to_arg`
+        self._arg_name_to_arg: dict[str, Input] | None = None
+        # the leaf type ref of `self.type`, its type is inferred once the whole schema is parsed
+        self._leaf_ref: TypeRef | None = None if self.type is None else self.type._leaf_ref
 
     def __repr__(self) -> str:
         """Return a more detailed string representation of the field instance."""
         class_name = self.__class__.__name__
         return f"<{class_name}(name=`{self.name}`, type={self.type})>"
 
+    __str__ = __repr__
+
     @property
     def arg_name_to_arg(self) -> dict[str, Input]:
         """Property for mapping the argument name to the argument for faster lookups.
 
+        The mapping is built once on first access, the schema does not change after parsing.
+
         Returns:
             A dictionary where the argument name is mapped to the argument itself
         """
-        return {arg.name: arg for arg in self.args}
+        if self._arg_name_to_arg is None:
+            self._arg_name_to_arg = {arg.name: arg for arg in self.args}
+        return self._arg_name_to_arg
 
     @property
     def output_type(self) -> Optional["Type"]:
-        if self.type is None:
+        """Property to return the output type (which is the leaf type)
+
+        Returns:
+            Either None (if `self.type` is None) or the leaf type
+        """
+        if self._leaf_ref is None:
             return None
-        return self.type.leaf_type
+        return self._leaf_ref.type
 
     @property
     def output_type_name(self) -> str | None:
@@ -350,17 +445,21 @@ class Field:
     @property
     def is_object_kind(self) -> bool:
         """True if the field type is of kind OBJECT."""
-        return self.output_type and self.output_type.kind == Kind.OBJECT
+        output_type = self._leaf_ref.type if self._leaf_ref is not None else None
+        return output_type is not None and output_type.kind is Kind.OBJECT
 
     @property
     def is_scalar_kind(self) -> bool:
         """True if the field type is of kind SCALAR."""
-        return self.output_type and self.output_type.kind == Kind.SCALAR
+        output_type = self._leaf_ref.type if self._leaf_ref is not None else None
+        return output_type is not None and output_type.kind is Kind.SCALAR
 
 
 class EnumValue:
     """Represents a basic graphql enum value."""
 
+    __slots__ = ("name", "description", "is_deprecated", "deprecation_reason")
+
     @classmethod
     def parse(cls, enum_value: Union["EnumValue", dict]) -> "EnumValue":
         """Parse a single field.
@@ -372,7 +471,7 @@ class EnumValue:
             the parsed field
         """
         if isinstance(enum_value, dict):
-            enum_value = cls(**enum_value)
+            return cls(**enum_value)
         if not isinstance(enum_value, cls):
             raise TypeError(f"Expected dict, {cls.__name__} got {type(enum_value)}")
         return enum_value
@@ -387,7 +486,7 @@ class EnumValue:
         Returns:
             a list of enum values
         """
-        return [cls.parse(enum_value) for enum_value in enum_values if enum_value] if enum_values else []
+        return _build_list(cls, enum_values)
 
     def __init__(
         self,
@@ -401,26 +500,36 @@ class EnumValue:
         self.is_deprecated: bool | None = isDeprecated
         self.deprecation_reason: str | None = deprecationReason
 
-    def __str__(self) -> str:
-        """Return a simple string representation of the enum value instance."""
-        return repr(self)
-
     def __repr__(self) -> str:
         """Return a more detailed string representation of the enum value instance."""
         class_name = self.__class__.__name__
         return f"<{class_name}(name=`{self.name}`)>"
 
+    __str__ = __repr__
+
 
 class Type:
     """Represents a basic graphql Type."""
 
+    __slots__ = (
+        "kind",
+        "name",
+        "description",
+        "fields",
+        "input_fields",
+        "interfaces",
+        "possible_types",
+        "_enum_values",
+        "_raw_enum_values",
+        "_field_name_to_field",
+    )
+
     kind: Kind | None
     name: str | None
     description: str | None
     fields: list[Field] | None
     input_fields: list[Input] | None
     interfaces: list[TypeRef] | None
-    enum_values: list[EnumValue] | None
     possible_types: list[TypeRef] | None
 
     @classmethod
@@ -434,7 +543,7 @@ class Type:
             the parsed field
         """
         if isinstance(type_value, dict):
-            type_value = cls(**type_value)
+            return cls(**type_value)
         if not isinstance(type_value, cls):
             raise TypeError(f"Expected dict, {cls.__name__} got {type(type_value)}")
         return type_value
@@ -450,14 +559,32 @@ class Type:
         enumValues: list[EnumValue | dict] | None = None,  # noqa
         possibleTypes: list[TypeRef | dict] | None = None,  # noqa
     ):
-        self.kind: Kind | None = Kind(kind) if kind else None
-        self.name: str | None = name
+        self.kind: Kind | None = _to_kind(kind)
+        self.name: str | None = sys.intern(name) if name else name
         self.description: str | None = description
-        self.fields: list[Field] = Field.parse_list(fields)
-        self.input_fields: list[Input] = Input.parse_list(inputFields)
-        self.interfaces: list[TypeRef] = TypeRef.parse_list(interfaces)
-        self.enum_values: list[EnumValue] = EnumValue.parse_list(enumValues)
-        self.possible_types: list[TypeRef] = TypeRef.parse_list(possibleTypes)
+        self.fields: list[Field] = _build_list(Field, fields)
+        self.input_fields: list[Input] = _build_list(Input, inputFields)
+        self.interfaces: list[TypeRef] = _build_list(TypeRef, interfaces)
+        # the enum values are not needed to infer the schema types, they are built on first access
+        self._enum_values: list[EnumValue] | None = None
+        self._raw_enum_values: list[EnumValue | dict] | None = enumValues
+        self.possible_types: list[TypeRef] = _build_list(TypeRef, possibleTypes)
+        # built on first access, see `field_name_to_field`
+        self._field_name_to_field: dict[str, Field] | None = None
+
+    @property
+    def enum_values(self) -> list[EnumValue]:
+        """Property for the values of this enum type.
+
+        The enum values are built from the introspection result on first access.
+
+        Returns:
+            a list of enum values, empty if this is not an enum type
+        """
+        if self._enum_values is None:
+            self._enum_values = _build_list(EnumValue, self._raw_enum_values)
+            self._raw_enum_values = None
+        return self._enum_values
 
     def infer_types(self, types_dict: dict[str, "Type"]):
         """Method to infer the types for all graphql schema types.
@@ -470,39 +597,50 @@ class Type:
             types_dict: Holds a dictionary with the name of the typed
                         mapped to the actual graphql schema type.
         """
-        if self.fields is not None:
-            for type_field in self.fields:
-                type_field.type.infer_type_refs(types_dict)
-
-        if self.input_fields is not None:
-            for input_field in self.input_fields:
-                input_field.type.infer_type_refs(types_dict)
-
-        if self.interfaces is not None:
-            for interface in self.interfaces:
-                interface.infer_type_refs(types_dict)
-
-        if self.possible_types is not None:
-            for possible_type in self.possible_types:
-                possible_type.infer_type_refs(types_dict)
+        # walk every of_type chain in a flat loop instead of recursing per type ref
+        get_type = types_dict.get
+        type_refs = [type_field.type for type_field in self.fields] if self.fields else []
+        if self.input_fields:
+            type_refs.extend(input_field.type for input_field in self.input_fields)
+        if self.interfaces:
+            type_refs.extend(self.interfaces)
+        if self.possible_types:
+            type_refs.extend(self.possible_types)
+        for type_ref in type_refs:
+            while type_ref is not None:
+                type_ref.type = get_type(type_ref.name)
+                type_ref = type_ref.of_type_ref
 
     @property
     def field_name_to_field(self) -> dict[str, Field]:
         """Property for mapping the field name to the field for faster lookups.
 
+        The mapping is built once on first access, the schema does not change after parsing.
+
         Returns:
             A dictionary where the field name is mapped to the field itself
         """
-        return {
-            field.name: field
-            for field in self.fields or []  # because self.fields might be None
-        }
+        if self._field_name_to_field is None:
+            self._field_name_to_field = {
+                field.name: field
+                for field in self.fields or []  # because self.fields might be None
+            }
+        return self._field_name_to_field
 
-    def __str__(self) -> str:
-        """Return a simple string representation of the type instance."""
-        return repr(self)
+    def resolve_field(self, name: str) -> Field | None:
+        """Method to look up a field of this type by its name.
+
+        Args:
+            name: holds the name of the field
+
+        Returns:
+            the field, None if this type has no field with that name
+        """
+        return self.field_name_to_field.get(name)
 
     def __repr__(self) -> str:
         """Return a more detailed string representation of the type instance."""
         class_name = self.__class__.__name__
         return f"<{class_name}(name=`{self.name}`)>"
+
+    __str__ = __repr__
@@ -2,7 +2,10 @@
 
 from qlient.core._types import RawSchema
 from qlient.core.exceptions import NoTypesFound
-from qlient.core.schema.models import Directive, Type
+from qlient.core.schema.models import Directive, Kind, Type
+
+# only types of these kinds reference other types, scalars and enums have nothing to infer
+_INFERABLE_KINDS = frozenset((Kind.OBJECT, Kind.INTERFACE, Kind.UNION, Kind.INPUT_OBJECT))
 
 
 class ParseResult:
@@ -30,29 +33,36 @@ def extract_type(type_name: str | None, types: dict[str, Type]) -> Type | None:
     return types.get(type_name)
 
 
+def _resolve_root(schema: dict, key: str, types: dict[str, Type] | None) -> Type | None:
+    """Resolve one of the root operation types of the schema.
+
+    Args:
+        schema: holds the schema to resolve the root type from
+        key: holds the key of the root type in the schema (e.g. "queryType")
+        types: holds the parsed types of the schema
+
+    Returns:
+        the root type, None if the schema does not define it
+    """
+    root_type: dict | None = schema.get(key)
+    if not root_type:
+        return None
+    return extract_type(root_type.get("name"), types)
+
+
 def extract_query_type(schema: dict, types: dict[str, Type] | None) -> Type | None:
     """Extract the name of the query type from the schema."""
-    query_type: dict | None = schema.get("queryType")
-    query_type_name: str | None = query_type.get("name")
-    return extract_type(query_type_name, types)
+    return _resolve_root(schema, "queryType", types)
 
 
 def extract_mutation_type(schema: dict, types: dict[str, Type] | None) -> Type | None:
     """Extract the name of the mutation type from the schema."""
-    mutation_type: dict | None = schema.get("mutationType")
-    if not mutation_type:
-        return None
-    mutation_type_name: str | None = mutation_type.get("name")
-    return extract_type(mutation_type_name, types)
+    return _resolve_root(schema, "mutationType", types)
 
 
 def extract_subscription_type(schema: dict, types: dict[str, Type] | None) -> Type | None:
     """Extract the name of the subscription type from the schema."""
-    subscription_type: dict | None = schema.get("subscriptionType")
-    if not subscription_type:
-        return None
-    subscription_type_name: str | None = subscription_type.get("name")
-    return extract_type(subscription_type_name, types)
+    return _resolve_root(schema, "subscriptionType", types)
 
 
 def parse_types(schema: dict) -> dict[str, Type]:
@@ -75,12 +85,17 @@ def parse_types(schema: dict) -> dict[str, Type]:
     if not types_list:
         raise NoTypesFound(schema)
 
-    types_list: list[Type] = [Type.parse(type_dict) for type_dict in types_list if type_dict]
-
-    types_dict: dict[str, Type] = {_type.name: _type for _type in types_list if _type}
+    types_dict: dict[str, Type] = {}
+    for type_dict in types_list:
+        if not type_dict:
+            continue
+        # introspection results are plain dictionaries, build the types from them directly
+        _type = Type(**type_dict) if type_dict.__class__ is dict else Type.parse(type_dict)
+        types_dict[_type.name] = _type
 
     for _type in types_dict.values():
-        _type.infer_types(types_dict)
+        if _type.kind in _INFERABLE_KINDS:
+            _type.infer_types(types_dict)
 
     return types_dict
 
@@ -1,5 +1,6 @@
 import logging
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
 from qlient.core._types import RawSchema
 from qlient.core.schema.models import Directive, Type
@@ -29,17 +30,45 @@ class Schema:
         self.subscription_type: Type | None = parse_result.subscription_type
         self.types_registry: dict[str, Type] = parse_result.types
         self.directives_registry: dict[str, Directive] = parse_result.directives
+        # least recently used prepared selections, see `qlient.core.models.Fields.prepare`
+        self.prepared_fields_cache: OrderedDict[tuple[int, Any], Any] = OrderedDict()
+        # the types by case-folded name, built on the first case-insensitive lookup
+        self._types_ci: dict[str, Type] | None = None
         logger.debug("Schema successfully introspected")
 
     def __eq__(self, other: "Schema"):
         return self.raw_schema == other.raw_schema and self.schema_provider == other.schema_provider
 
-    def __getattr__(self, key) -> Type | None:
-        return self[key]
+    def __getattr__(self, key: str) -> Type | None:
+        # private and special names are never types, e.g. when copy or pickle probe for hooks.
+        # Look those up with `schema[key]` instead.
+        if key.startswith("_"):
+            raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {key!r}")
+        # read the registry from the instance dict, a missing registry must not recurse into __getattr__
+        types_registry = self.__dict__.get("types_registry")
+        return types_registry.get(key) if types_registry is not None else None
 
     def __getitem__(self, key) -> Type | None:
         return self.types_registry.get(key)
 
+    def get(self, key: str, *, case_insensitive: bool = False) -> Type | None:
+        """Get a type of the schema by its name.
+
+        Args:
+            key: holds the name of the type
+            case_insensitive: whether to ignore the case of the name (e.g. "user" finds "User"),
+                an exact match is always preferred
+
+        Returns:
+            the type, None if the schema has no type with that name
+        """
+        _type = self.types_registry.get(key)
+        if _type is not None or not case_insensitive:
+            return _type
+        if self._types_ci is None:
+            self._types_ci = {name.casefold(): _type for name, _type in self.types_registry.items()}
+        return self._types_ci.get(key.casefold())
+
     def __str__(self) -> str:
         """Return a simple string representation of the schema instance."""
         return repr(self)
@@ -1,9 +1,36 @@
 """This file contains the settings that can be overwritten in the qlient Client."""
 
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if orjson is not None:
+    default_json_loads: Callable[[str | bytes], Any] = orjson.loads
+    default_json_dumps_bytes: Callable[[Any], bytes] = orjson.dumps
+
+    def default_json_dumps(obj: Any) -> str:
+        """Serialize the given object to a json string using orjson."""
+        return orjson.dumps(obj).decode()
+
+else:  # pragma: no cover
+    default_json_loads: Callable[[str | bytes], Any] = json.loads
+    default_json_dumps: Callable[..., str] = json.dumps
+
+    def default_json_dumps_bytes(obj: Any) -> bytes:
+        """Serialize the given object to utf-8 encoded json using the stdlib."""
+        return json.dumps(obj).encode()
+
 
 class Settings:
     """Class that represents the settings that can be adjusted to your liking."""
 
+    __slots__ = ("use_schema_description", "allow_auto_lookup", "lookup_recursion_depth")
+
     def __init__(
         self,
         use_schema_description: bool = True,
@@ -28,3 +55,36 @@ class Settings:
             f"lookup_recursion_depth={self.lookup_recursion_depth}"
             f")>"
         )
+
+
+class JSONSettings(Settings):
+    """Class that represents the settings of a backend that (de)serializes json.
+
+    When `orjson` is installed it is used for (de)serialization by default,
+    otherwise the stdlib `json` module is used.
+
+    `json_dumps_bytes` is used wherever the serialized payload goes straight onto the wire. If it is omitted but a
+    custom `json_dumps` is given, the output of `json_dumps` is utf-8 encoded instead.
+    """
+
+    __slots__ = ("json_loads", "json_dumps", "json_dumps_bytes")
+
+    def __init__(
+        self,
+        json_loads: Callable[[str | bytes], Any] = default_json_loads,
+        json_dumps: Callable[..., str] = default_json_dumps,
+        json_dumps_bytes: Callable[[Any], bytes] | None = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        if json_dumps_bytes is None:
+            if json_dumps is default_json_dumps:
+                json_dumps_bytes = default_json_dumps_bytes
+            else:
+
+                def json_dumps_bytes(obj: Any) -> bytes:
+                    return json_dumps(obj).encode()
+
+        self.json_loads: Callable[[str | bytes], Any] = json_loads
+        self.json_dumps: Callable[..., str] = json_dumps
+        self.json_dumps_bytes: Callable[[Any], bytes] = json_dumps_bytes
@@ -1,6 +1,6 @@
 import pytest
 
-from qlient.core.models import Directive, Field, Fields, PreparedDirective
+from qlient.core.models import Directive, Field, Fields, GraphQLResponse, PreparedDirective, PreparedField
 
 
 # skipcq: PY-D0003
@@ -19,10 +19,25 @@ def test_directive_comparison():
     assert Directive("foo") == Directive("foo")
 
 
+def test_directive_is_interned():
+    assert Directive("foo") is Directive("foo")
+    assert Directive("foo") is not Directive("bar")
+
+
+def test_directive_copy_and_pickle():
+    import copy
+    import pickle
+
+    field = Field("x", _directive=Directive("include"))
+    assert copy.copy(Directive("include")) is Directive("include")
+    assert copy.deepcopy(field).directive is Directive("include")
+    assert pickle.loads(pickle.dumps(field)) == field
+    assert copy.deepcopy(Fields(field)) == Fields(field)
+
+
 # skipcq: PY-D0003
 def test_directive_comparison_with_different_type():
-    with pytest.raises(TypeError):
-        assert Directive("foo") == 0
+    assert Directive("foo") != 0
 
 
 # skipcq: PY-D0003
@@ -92,8 +107,7 @@ def test_prepared_directive__eq__wrong_type():
     directive_a = PreparedDirective()
     directive_a.prepare_name("include")
 
-    with pytest.raises(TypeError):
-        directive_a == 1  # noqa
+    assert directive_a != 1
 
 
 # skipcq: PY-D0003
@@ -163,14 +177,22 @@ def test_field_and_other_field():
 
 
 def test_field_eq_unknown():
-    with pytest.raises(TypeError):
-        assert Field("a") == object()
+    assert Field("a") != object()
+    assert Field("a") not in {object()}
+
+
+def test_field_hash_is_cached():
+    field = Field("a", _sub_fields=["b", {"c": "d"}])
+    assert field._hash is None
+    assert hash(field) == hash(field)
+    assert field._hash == hash(field)
+    assert field.sub_fields._hash is not None
 
 
 # skipcq: PY-D0003
 def test_fields_simple_single():
     a = Fields("a")
-    assert a.selected_fields == [Field("a")]
+    assert a.selected_fields == (Field("a"),)
 
 
 # skipcq: PY-D0003
@@ -187,6 +209,32 @@ def test_fields_simple_multiple_duplicates():
     assert len(a.selected_fields) == 3
 
 
+def test_fields_contains():
+    fields = Fields("a", Field("b", _alias="c"), d="e")
+    assert "a" in fields
+    assert "d" in fields
+    assert Field("b", _alias="c") in fields
+    assert Field("b") not in fields
+    assert Field("d") not in fields
+    assert 1 not in fields
+
+
+def test_fields_same_name_and_alias_merges_sub_fields():
+    a = Fields("a", Field("a", _alias="b"), {"a": "c"})
+    assert a.selected_fields == (Field("a", _sub_fields="c"), Field("a", _alias="b"))
+
+    planet = Fields(planet=["id"]) & Fields(planet=["name"])
+    assert planet.selected_fields == (Field("planet", _sub_fields=["id", "name"]),)
+
+
+def test_fields_same_name_with_different_directive_keeps_both():
+    include = Field("a", _directive=Directive("include"))
+    a = Fields("a") + include
+    assert a.selected_fields == (Field("a"), include)
+    assert include in a
+    assert "a" in a
+
+
 # skipcq: PY-D0003
 def test_fields_simple_list():
     a = Fields(["a", "b", "c"])
@@ -318,7 +366,8 @@ def test_fields_complex_add_operator_dict():
     a = Fields("a", b="b")
     actual = a + {"b": ["c", "e"]}
     assert Field("a") in actual.selected_fields
-    assert Field("b", _sub_fields=["c", "e"]) in actual.selected_fields
+    # both selections of `b` are merged into one
+    assert Field("b", _sub_fields=["b", "c", "e"]) in actual.selected_fields
 
 
 # skipcq: PY-D0003
@@ -354,3 +403,117 @@ def test_graphql_response(graphql_response):
     assert graphql_response.data == {"testOperation": {"foo": "", "bar": ""}}
     assert graphql_response.errors == []
     assert graphql_response.extensions == []
+
+
+def test_graphql_response_without_dict(graphql_request):
+    response = GraphQLResponse(graphql_request, iter([]))
+    assert response.data is None
+    assert response.errors is None
+    assert response.extensions is None
+    assert not hasattr(response, "__dict__")
+
+
+def test_fields_prepare_nested_selection(swapi_schema):
+    fields = Fields("totalCount", films=["id", Field("title", _alias="name")])
+    prepared = fields.prepare(swapi_schema.query_type.field_name_to_field["allFilms"].type.leaf_type, swapi_schema)
+    assert prepared.__gql__() == "totalCount films { id name: title }"
+    assert prepared.render() is prepared.__gql__()
+    assert prepared.fields[1].sub_fields.fields[1].field_type.name == "title"
+
+
+def test_fields_prepare_is_cached_per_schema(swapi_schema, monkeypatch):
+    film_type = swapi_schema.query_type.field_name_to_field["film"].type.leaf_type
+    prepared = Fields("id", "title").prepare(film_type, swapi_schema)
+    assert Fields("id", "title").prepare(film_type, swapi_schema) is prepared
+
+    monkeypatch.setattr("qlient.core.models.PREPARED_FIELDS_CACHE_SIZE", 1)
+    Fields("id").prepare(film_type, swapi_schema)
+    assert len(swapi_schema.prepared_fields_cache) == 1
+    assert Fields("id", "title").prepare(film_type, swapi_schema) is not prepared
+
+
+def test_fields_prepare_cache_does_not_mix_up_equal_hashes(swapi_schema):
+    film_type = swapi_schema.query_type.field_name_to_field["film"].type.leaf_type
+    first, second = Fields("id"), Fields("title")
+    second._hash = hash(first)
+    assert first != second
+
+    assert first.prepare(film_type, swapi_schema).__gql__() == "id"
+    assert second.prepare(film_type, swapi_schema).__gql__() == "title"
+
+
+def test_fields_prepare_from_threads(swapi_schema, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr("qlient.core.models.PREPARED_FIELDS_CACHE_SIZE", 2)
+    film_type = swapi_schema.query_type.field_name_to_field["film"].type.leaf_type
+    selections = [Fields(name) for name in ("id", "title", "director", "producers")] * 250
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda fields: fields.prepare(film_type, swapi_schema).__gql__(), selections))
+    assert results == [fields.selected_fields[0].name for fields in selections]
+
+
+def test_fields_models_have_no_instance_dict(swapi_schema):
+    film_type = swapi_schema.query_type.field_name_to_field["film"].type.leaf_type
+    fields = Fields(Field("title", _directive=Directive("include")))
+    prepared = fields.prepare(film_type, swapi_schema)
+    for instance in (fields, fields.selected_fields[0], Directive("include"), prepared, prepared.fields[0]):
+        assert not hasattr(instance, "__dict__")
+
+
+def test_prepared_field_gql_with_alias_and_directive(swapi_schema):
+    film_type = swapi_schema.query_type.field_name_to_field["film"].type.leaf_type
+    fields = Fields(Field("title", _alias="name", _directive=Directive("include")))
+    assert fields.prepare(film_type, swapi_schema).render() == "name: title @include"
+
+
+def test_fields_add_fields_merges_without_reparsing():
+    a = Fields("a", "b")
+    b = Fields(Field("b", _sub_fields="c"), "d")
+    merged = a + b
+    assert merged.selected_fields == (Field("a"), Field("b", _sub_fields="c"), Field("d"))
+    assert "d" in merged
+    assert a.selected_fields == (Field("a"), Field("b"))
+
+
+def test_field_sub_fields_are_parsed_on_construction():
+    sub = ["a"]
+    fields = Fields(foo=sub)
+    sub.append("b")
+    assert fields.selected_fields[0].sub_fields == Fields("a")
+
+    with pytest.raises(TypeError):
+        Fields(foo=42)
+
+
+def test_fields_add_subclass_of_supported_type():
+    class MyList(list):
+        pass
+
+    assert (Fields("a") + MyList(["b"])).selected_fields == (Field("a"), Field("b"))
+    assert (Field("a") + MyList(["b"])).selected_fields == (Field("a"), Field("b"))
+    with pytest.raises(TypeError):
+        Fields("a") + 1  # noqa
+
+
+def test_prepared_field_from_validated(swapi_schema):
+    film_type = swapi_schema.query_type.field_name_to_field["film"].type.leaf_type
+    title = film_type.field_name_to_field["title"]
+    directive = Directive("include").prepare(swapi_schema)
+
+    field = PreparedField.from_validated(film_type, title, "title", "name", directive)
+    assert field.field_type is title
+    assert field.__gql__() == "name: title @include"
+
+
+def test_fields_prepare_unknown_nested_field(swapi_schema):
+    film_type = swapi_schema.query_type.field_name_to_field["allFilms"].type.leaf_type
+    with pytest.raises(ValueError):
+        Fields(films=["id", "doesNotExist"]).prepare(film_type, swapi_schema)
+
+
+@pytest.mark.parametrize("other", [None, Fields(), "", [], (), set(), {}])
+def test_fields_add_nothing_returns_same_instance(other):
+    fields = Fields("a")
+    assert fields + other is fields
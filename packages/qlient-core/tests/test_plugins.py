@@ -30,3 +30,24 @@ def test_apply_post(my_plugin, graphql_response):
     apply_post([my_plugin], graphql_response)
     assert my_plugin.post_called
     assert not my_plugin.pre_called
+
+
+def test_apply_skips_plugins_without_overrides(graphql_response, graphql_request):
+    class PrePlugin(Plugin):
+        def pre(self, request):
+            return "pre"
+
+    assert apply_pre([Plugin(), PrePlugin()], graphql_request) == "pre"
+    assert apply_post([Plugin(), PrePlugin()], graphql_response) is graphql_response
+
+
+def test_apply_uses_hooks_set_on_the_instance(graphql_response, graphql_request):
+    from unittest import mock
+
+    plugin = Plugin()
+    plugin.pre = lambda request: "pre"
+    assert apply_pre([plugin], graphql_request) == "pre"
+
+    other = Plugin()
+    with mock.patch.object(other, "post", return_value="post"):
+        assert apply_post([other], graphql_response) == "post"
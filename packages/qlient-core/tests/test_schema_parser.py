@@ -96,3 +96,12 @@ def test_parse_schema(raw_swapi_schema):
     assert parse_result.query_type is not None
     assert parse_result.mutation_type is None
     assert parse_result.subscription_type is None
+
+
+# skipcq: PY-D0003
+def test_query_type_extraction_without_query_type(raw_swapi_schema):
+    from qlient.core.schema.parser import extract_query_type, parse_types
+
+    types = parse_types(raw_swapi_schema)
+    assert extract_query_type({"queryType": None}, types) is None
+    assert extract_query_type({}, types) is None
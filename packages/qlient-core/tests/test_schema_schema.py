@@ -14,3 +14,26 @@ def test_schema(swapi_schema):
     assert swapi_schema.Root == swapi_schema.query_type
 
     assert str(swapi_schema) == "<Schema(query_type=<Type(name=`Root`)>, mutation_type=None, subscription_type=None)>"
+
+
+# skipcq: PY-D0003
+def test_schema_getattr_private_names(swapi_schema):
+    import copy
+
+    import pytest
+
+    with pytest.raises(AttributeError):
+        getattr(swapi_schema, "_private")
+    assert not hasattr(swapi_schema, "__deepcopy__")
+    assert swapi_schema.Film is swapi_schema["Film"]
+    assert swapi_schema.DoesNotExist is None
+    assert copy.copy(swapi_schema).query_type is swapi_schema.query_type
+
+
+# skipcq: PY-D0003
+def test_schema_get(swapi_schema):
+    assert swapi_schema.get("Film") is swapi_schema["Film"]
+    assert swapi_schema.get("film") is None
+    assert swapi_schema.get("film", case_insensitive=True) is swapi_schema["Film"]
+    assert swapi_schema.get("FILMSCONNECTION", case_insensitive=True) is swapi_schema["FilmsConnection"]
+    assert swapi_schema.get("DoesNotExist", case_insensitive=True) is None
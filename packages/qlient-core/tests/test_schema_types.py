@@ -62,3 +62,117 @@ def test_input_values():
 
     input_type = Input(name="first_name")
     assert input_type.name == "first_name"
+
+
+# skipcq: PY-D0003
+def test_type_resolve_field():
+    from qlient.core.schema.models import Type
+
+    _type = Type(name="Query", fields=[{"name": "foo"}, {"name": "bar"}])
+    assert _type.resolve_field("bar") is _type.fields[1]
+    assert _type.resolve_field("baz") is None
+
+
+def test_name_lookups_are_cached():
+    from qlient.core.schema.models import Directive, Field, Type
+
+    _type = Type(name="Query", fields=[{"name": "foo", "args": [{"name": "id"}]}])
+    assert _type.field_name_to_field is _type.field_name_to_field
+    field = _type.field_name_to_field["foo"]
+    assert field.arg_name_to_arg is field.arg_name_to_arg
+    assert field.arg_name_to_arg["id"] is field.args[0]
+
+    directive = Directive(name="include", args=[{"name": "if"}])
+    assert directive.arg_name_to_arg is directive.arg_name_to_arg
+    assert directive.arg_name_to_arg["if"] is directive.args[0]
+
+
+def test_field_output_type_after_inference():
+    from qlient.core.schema.models import Field, Type
+
+    film = Type(kind="OBJECT", name="Film")
+    field = Field(name="films", type={"kind": "NON_NULL", "ofType": {"kind": "LIST", "ofType": {"name": "Film"}}})
+    assert field.type.leaf_type_name == "Film"
+    assert field.output_type is None
+    assert field.is_object_kind is False
+
+    field.type.infer_type_refs({"Film": film})
+    assert field.type.leaf_type is film
+    assert field.output_type is film
+    assert field.output_type_name == "Film"
+    assert field.is_object_kind is True
+    assert field.is_scalar_kind is False
+
+
+def test_type_infer_types():
+    from qlient.core.schema.models import Type
+
+    film = Type(kind="OBJECT", name="Film")
+    node = Type(kind="INTERFACE", name="Node")
+    _type = Type(
+        kind="OBJECT",
+        name="Query",
+        fields=[{"name": "film", "type": {"kind": "NON_NULL", "ofType": {"name": "Film"}}}, {"name": "untyped"}],
+        interfaces=[{"kind": "INTERFACE", "name": "Node"}],
+    )
+    _type.infer_types({"Film": film, "Node": node})
+    assert _type.fields[0].type.type is None
+    assert _type.fields[0].output_type is film
+    assert _type.interfaces[0].type is node
+
+
+def test_schema_models_use_slots(swapi_schema):
+    query_type = swapi_schema.query_type
+    field = query_type.field_name_to_field["film"]
+    directive = next(iter(swapi_schema.directives_registry.values()))
+    for instance in (query_type, field, field.type, field.args[0], directive):
+        assert not hasattr(instance, "__dict__")
+
+
+def test_type_ref_kind_and_name_are_shared():
+    import pytest
+
+    from qlient.core.schema.models import Kind, TypeRef
+
+    first = TypeRef(kind="SCALAR", name="".join(["Str", "ing"]))
+    second = TypeRef(kind=Kind.SCALAR, name="".join(["Stri", "ng"]))
+    assert first.kind is second.kind is Kind.SCALAR
+    assert first.name is second.name
+    with pytest.raises(ValueError):
+        TypeRef(kind="NOT_A_KIND")
+
+
+def test_type_ref_representations_are_cached():
+    from qlient.core.schema.models import TypeRef
+
+    type_ref = TypeRef(kind="NON_NULL", ofType={"kind": "LIST", "ofType": {"kind": "SCALAR", "name": "ID"}})
+    assert type_ref.graphql_representation == "[ID]!"
+    assert type_ref.graphql_representation is type_ref.__gql__()
+    assert repr(type_ref) is repr(type_ref)
+    assert str(type_ref).startswith("<TypeRef(kind=`NON_NULL`, name=`None`, ofType=<TypeRef(kind=`LIST`")
+
+
+def test_type_enum_values_are_built_lazily():
+    from qlient.core.schema.models import EnumValue, Type
+
+    _type = Type(kind="ENUM", name="Episode", enumValues=[{"name": "NEWHOPE"}, {"name": "EMPIRE"}])
+    enum_values = _type.enum_values
+    assert [enum_value.name for enum_value in enum_values] == ["NEWHOPE", "EMPIRE"]
+    assert isinstance(enum_values[0], EnumValue)
+    assert _type.enum_values is enum_values
+    assert Type(kind="SCALAR", name="String").enum_values == []
+
+
+def test_schema_models_from_kwargs():
+    import pytest
+
+    from qlient.core.schema.models import Field, Type, TypeRef
+
+    _type = Type(kind="OBJECT", name="Query", fields=[{"name": "film", "args": [{"name": "id"}]}])
+    assert _type.name == "Query"
+    field = _type.fields[0]
+    assert field.arg_name_to_arg["id"].name == "id"
+    assert Field.parse(field) is field
+    assert TypeRef.parse({"name": "Film"}).name == "Film"
+    with pytest.raises(TypeError):
+        TypeRef.parse("Film")
@@ -8,3 +8,13 @@ def test_settings():
     assert settings.use_schema_description
 
     assert isinstance(str(settings), str)
+
+
+def test_json_settings():
+    from qlient.core.settings import JSONSettings
+
+    settings = JSONSettings()
+    assert settings.json_loads(settings.json_dumps({"a": 1})) == {"a": 1}
+    assert settings.json_loads(settings.json_dumps_bytes({"a": 1})) == {"a": 1}
+    assert JSONSettings(json_dumps=lambda _: "dumped").json_dumps_bytes({}) == b"dumped"
+    assert not hasattr(settings, "__dict__")
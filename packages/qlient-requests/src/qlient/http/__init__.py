@@ -1,8 +1,42 @@
 """The exports for the qlient.http module."""
 
-# skipcq: PY-W2000
-from qlient.core import *  # noqa
+from qlient.core import (
+    AsyncBackend,
+    AsyncClient,
+    Backend,
+    Client,
+    Directive,
+    Field,
+    Fields,
+    GraphQLRequest,
+    GraphQLResponse,
+    GraphQLSubscriptionRequest,
+    OutOfAsyncContext,
+    Plugin,
+    QlientException,
+    Settings,
+)
 
-from qlient.http.backends import HTTPBackend  # skipcq: PY-W2000
-from qlient.http.clients import HTTPClient  # skipcq: PY-W2000
-from qlient.http.settings import HTTPSettings  # skipcq: PY-W2000
+from qlient.http.backends import HTTPBackend
+from qlient.http.clients import HTTPClient
+from qlient.http.settings import HTTPSettings
+
+__all__ = [
+    "HTTPBackend",
+    "HTTPClient",
+    "HTTPSettings",
+    "AsyncBackend",
+    "AsyncClient",
+    "Backend",
+    "Client",
+    "Directive",
+    "Field",
+    "Fields",
+    "GraphQLRequest",
+    "GraphQLResponse",
+    "GraphQLSubscriptionRequest",
+    "OutOfAsyncContext",
+    "Plugin",
+    "QlientException",
+    "Settings",
+]
@@ -1,12 +1,15 @@
 """This module contains the http backend."""
 
+import functools
 import logging
-import uuid
+import os
 from typing import Dict, Any
 from urllib.parse import urlparse, urlunparse, ParseResult
 
 import requests
 import websocket
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
 
 from qlient.core import (
     Backend,
@@ -27,6 +30,72 @@ from qlient.http.settings import HTTPSettings
 
 logger = logging.getLogger("qlient")
 
+# the number of hosts and connections per host kept in the shared connection pool
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 16
+
+
+@functools.cache
+def _create_pool_manager(num_pools: int, maxsize: int, block: bool) -> PoolManager:
+    return PoolManager(num_pools=num_pools, maxsize=maxsize, block=block)
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    # a forked child must not reuse the keep-alive sockets of its parent
+    os.register_at_fork(after_in_child=_create_pool_manager.cache_clear)
+
+
+def get_shared_pool_manager(
+    num_pools: int = POOL_CONNECTIONS,
+    maxsize: int = POOL_MAXSIZE,
+    block: bool = False,
+) -> PoolManager:
+    """Get the connection pool manager that is shared by all sessions created by the backends.
+
+    Sharing the pool lets short-lived clients reuse open connections
+    instead of paying for a new tcp and tls handshake per client.
+    Each distinct pool configuration gets its own shared manager,
+    a forked child process starts with fresh ones.
+
+    Args:
+        num_pools: holds the number of hosts to keep a connection pool for
+        maxsize: holds the number of connections kept per host
+        block: whether to block when the pool of a host has no free connection
+
+    Returns:
+        the shared PoolManager
+    """
+    return _create_pool_manager(num_pools, maxsize, block)
+
+
+class SharedPoolAdapter(HTTPAdapter):
+    """Transport adapter that sends its requests through a shared pool manager.
+
+    Closing the adapter (e.g. by closing its session) leaves the shared pool open,
+    it is still used by the sessions of the other backends.
+    Extra pool keyword arguments (e.g. ssl options) get a private pool instead.
+    """
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any):
+        if pool_kwargs:
+            self._owns_pool = True
+            super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+            return
+        # save these values for pickling, same as the HTTPAdapter
+        self._owns_pool = False
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = get_shared_pool_manager(connections, maxsize, block)
+
+    def close(self):
+        if self._owns_pool:
+            super().close()
+            return
+        # only the proxy managers belong to this adapter
+        for proxy in self.proxy_manager.values():
+            proxy.clear()
+
 
 class HTTPBackend(Backend):
     """The HTTPBackend.
@@ -60,7 +129,7 @@ class HTTPBackend(Backend):
         Returns:
             A unique subscription id
         """
-        return f"qlient:{cls.__name__}:{uuid.uuid4()}".replace("-", "")
+        return f"qlient:{cls.__name__}:{os.urandom(16).hex()}"
 
     @staticmethod
     def make_payload(request: GraphQLRequest) -> dict[str, Any]:
@@ -89,13 +158,32 @@ class HTTPBackend(Backend):
             settings = HTTPSettings()
 
         if session is None:
-            session = requests.Session()
+            session = self.create_session()
 
         self.settings: HTTPSettings = settings
         self.endpoint: str = endpoint
         self.ws_endpoint: str = ws_endpoint or self.adapt_ws_endpoint(self.endpoint)
         self.session: requests.Session = session
 
+    @staticmethod
+    def create_session() -> requests.Session:
+        """Static method to create the session that is used when no session was given.
+
+        Override this method to customize the default session.
+
+        Each backend gets its own session (and with it its own headers and cookies),
+        but all of them share the connection pool of :func:`get_shared_pool_manager`.
+        A session passed to the backend is used as-is.
+
+        Returns:
+            a new requests.Session
+        """
+        session = requests.Session()
+        adapter = SharedPoolAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def execute_query(self, request: GraphQLRequest) -> GraphQLResponse:
         """Method to execute a query on the http server.
 
@@ -112,17 +200,17 @@ class HTTPBackend(Backend):
         Returns:
             the query GraphQLResponse
         """
-        payload_dict = self.make_payload(request)
-        payload_str = self.settings.json_dumps(payload_dict)
-        logger.debug(f"Sending request: {payload_str}")
+        payload = self.settings.json_dumps_bytes(self.make_payload(request))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending request: %s", payload.decode())
 
         response = self.session.post(
             self.endpoint,
-            data=payload_str,
+            data=payload,
             headers={"content-type": "application/json; charset=utf-8"},
         )
-        response_str = response.text
-        response_body = self.settings.json_loads(response_str)
+        # json_loads accepts the raw bytes, decoding them to str first would only be an extra pass
+        response_body = self.settings.json_loads(response.content)
         return GraphQLResponse(request, response_body)
 
     def execute_mutation(self, request: GraphQLRequest) -> GraphQLResponse:
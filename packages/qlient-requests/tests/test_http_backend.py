@@ -0,0 +1,55 @@
+import os
+
+import pytest
+import requests
+
+from qlient.http import HTTPBackend
+from qlient.http.backends import get_shared_pool_manager
+
+
+def test_http_backend_sessions_share_connection_pool():
+    first = HTTPBackend("http://localhost:8080/graphql")
+    second = HTTPBackend("http://localhost:8080/graphql")
+    assert first.session is not second.session
+    first_pool = first.session.get_adapter("http://localhost").poolmanager
+    assert first_pool is second.session.get_adapter("https://localhost").poolmanager
+
+
+def test_http_backend_closing_a_session_keeps_the_shared_pool():
+    first = HTTPBackend("http://localhost:8080/graphql")
+    second = HTTPBackend("http://localhost:8080/graphql")
+    pool = get_shared_pool_manager().connection_from_url("http://localhost:8080")
+
+    first.session.close()
+    assert (
+        second.session.get_adapter("http://localhost").poolmanager.connection_from_url("http://localhost:8080") is pool
+    )
+
+
+def test_http_backend_keeps_given_session():
+    session = requests.Session()
+    backend = HTTPBackend("http://localhost:8080/graphql", session=session)
+    assert backend.session is session
+    assert backend.session.get_adapter("http://localhost").poolmanager is not get_shared_pool_manager()
+
+
+def test_shared_pool_adapter_honours_pool_size():
+    from qlient.http.backends import SharedPoolAdapter
+
+    adapter = SharedPoolAdapter(pool_connections=2, pool_maxsize=4, pool_block=True)
+    assert adapter.poolmanager is get_shared_pool_manager(2, 4, True)
+    assert adapter.poolmanager is not get_shared_pool_manager()
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 4
+    assert adapter.poolmanager.connection_pool_kw["block"]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_gets_a_fresh_shared_pool():
+    parent_id = id(get_shared_pool_manager())
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        os.write(write_fd, b"1" if id(get_shared_pool_manager()) != parent_id else b"0")
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b"1"
@@ -0,0 +1,20 @@
+from qlient.http import HTTPSettings
+
+
+def test_http_settings_json_defaults():
+    settings = HTTPSettings()
+
+    payload = settings.json_dumps({"query": "query { foo }"})
+    assert isinstance(payload, str)
+    assert settings.json_loads(payload) == {"query": "query { foo }"}
+    assert settings.json_loads(payload.encode()) == {"query": "query { foo }"}
+    assert settings.json_loads(settings.json_dumps_bytes({"type": "stop"})) == {"type": "stop"}
+
+
+def test_http_settings_json_dumps_bytes_follows_custom_json_dumps():
+    def my_dumps(_):
+        return "dumped"
+
+    settings = HTTPSettings(json_dumps=my_dumps)
+    assert settings.json_dumps({}) == "dumped"
+    assert settings.json_dumps_bytes({}) == b"dumped"